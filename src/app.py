@@ -4,21 +4,14 @@ Main Application Module
 Main application class that orchestrates the Kubernetes kubelet security check Slack integration.
 """
 
-import os
+import signal
 import logging
+from functools import cached_property
 from typing import Optional
 
 from slack_app import SlackClient, SlackNotifier
-from kubelet_scanner import KubeletScanner, KubeletAnalyzer
 from utils import Config, setup_logging
 
-try:
-    from kubernetes.client.rest import ApiException
-    KUBERNETES_AVAILABLE = True
-except ImportError:
-    KUBERNETES_AVAILABLE = False
-    ApiException = None
-
 logger = logging.getLogger(__name__)
 
 
@@ -44,17 +37,30 @@ class KubeletCheckApp:
         # Initialize components
         self.slack_client = SlackClient(self.config.get_slack_token())
         self.slack_notifier = SlackNotifier(self.slack_client)
-        self.kubelet_scanner = KubeletScanner()
-        # Initialize analyzer with OpenAI if enabled
+        
+        logger.info("Kubernetes kubelet security check app initialized successfully")
+    
+    @cached_property
+    def kubelet_scanner(self):
+        """Kubelet scanner, created on first use so test mode skips the kubernetes client."""
+        from kubelet_scanner import KubeletScanner
+        return KubeletScanner(
+            node_cache_ttl=self.config.get_node_cache_ttl(),
+            watch_nodes=self.config.is_watch_nodes_enabled(),
+            node_name=self.config.get_node_name(),
+            scan_concurrency=self.config.get_scanner_concurrency()
+        )
+    
+    @cached_property
+    def kubelet_analyzer(self):
+        """Kubelet analyzer, with OpenAI if enabled."""
+        from kubelet_scanner import KubeletAnalyzer
         if self.config.is_openai_enabled():
-            self.kubelet_analyzer = KubeletAnalyzer(
+            return KubeletAnalyzer(
                 openai_api_key=self.config.get_openai_api_key(),
                 openai_model=self.config.get_openai_model()
             )
-        else:
-            self.kubelet_analyzer = KubeletAnalyzer()
-        
-        logger.info("Kubernetes kubelet security check app initialized successfully")
+        return KubeletAnalyzer()
     
     def run_sidecar_mode(self) -> int:
         """
@@ -67,6 +73,9 @@ class KubeletCheckApp:
         logger.info(f"📁 Monitoring directory: {self.config.get_output_dir()}")
         logger.info(f"📢 Target channel: {self.config.get_slack_channel()}")
         
+        # Stop promptly when the pod is terminated, restoring the previous handler once done
+        previous_handler = signal.signal(signal.SIGTERM, self._handle_sigterm)
+        
         try:
             # Send startup notification
             self.slack_notifier.client.send_message(
@@ -78,12 +87,16 @@ class KubeletCheckApp:
             success = self.slack_notifier.monitor_for_scan_output(
                 self.config.get_output_dir(),
                 self.config.get_max_wait_time(),
-                self.config.get_slack_channel()
+                self.config.get_slack_channel(),
+                poll=self.config.is_file_watch_polling()
             )
             
             if success:
                 logger.info("✅ Kubelet scan results sent successfully")
                 return 0
+            elif self.slack_notifier.stop_event.is_set():
+                logger.info("🛑 Sidecar stopped before scan results were found")
+                return 0
             else:
                 logger.error("❌ Failed to send kubelet scan results")
                 return 1
@@ -91,6 +104,23 @@ class KubeletCheckApp:
         except Exception as e:
             logger.error(f"❌ Error in sidecar mode: {e}")
             return 1
+        finally:
+            signal.signal(signal.SIGTERM, previous_handler)
+    
+    def _handle_sigterm(self, signum, frame) -> None:
+        """
+        Handle SIGTERM in sidecar mode.
+        
+        While waiting for scan results the wait is stopped so the sidecar can exit
+        cleanly; at any other point (startup message, analysis, Slack upload) there's
+        nothing to wind down, so the sidecar exits right away.
+        """
+        if self.slack_notifier.waiting_for_results:
+            self.slack_notifier.stop()
+            return
+        
+        logger.info("🛑 Received SIGTERM, exiting")
+        raise SystemExit(128 + signum)
     
     def run_scan_mode(self) -> int:
         """
@@ -102,8 +132,11 @@ class KubeletCheckApp:
         logger.info("🔐 Starting Kubernetes kubelet security scan...")
         
         try:
-            # Perform kubelet scan
-            scan_results = self.kubelet_scanner.scan_kubelet_config()
+            # Perform kubelet scan, releasing the scanner's pooled connections once done
+            try:
+                scan_results = self.kubelet_scanner.scan_kubelet_config()
+            finally:
+                self.kubelet_scanner.close()
             
             # Analyze results
             analysis = self.kubelet_analyzer.analyze_results(scan_results)
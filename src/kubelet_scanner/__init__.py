@@ -6,6 +6,7 @@ Scans Kubernetes cluster for kubelet security configuration issues.
 
 from .scanner import KubeletScanner
 from .analyzer import KubeletAnalyzer
+from .node_cache import NodeCache
 
-__all__ = ['KubeletScanner', 'KubeletAnalyzer']
+__all__ = ['KubeletScanner', 'KubeletAnalyzer', 'NodeCache']
 
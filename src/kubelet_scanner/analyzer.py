@@ -10,6 +10,25 @@ from typing import Dict, Any, List, Optional
 
 logger = logging.getLogger(__name__)
 
+# Static parts of the AI prompt; only the header fields and issue lists vary per scan
+_PROMPT_HEADER = """Analyze the following kubelet security scan results:
+
+Status: {status}
+Total Nodes: {total_nodes}
+Nodes with Issues: {nodes_with_issues}
+
+Critical Issues:
+"""
+
+_PROMPT_FOOTER = """
+Please provide:
+1. Overall risk assessment with severity
+2. Top 3-5 critical security concerns with business impact
+3. WHY IT'S DANGEROUS - Attack vectors and potential exploits
+4. EXPLANATION - What attackers could do with these vulnerabilities
+5. Prioritized remediation roadmap with time estimates
+"""
+
 
 class KubeletAnalyzer:
     """Analyzes kubelet scan results and provides risk insights."""
@@ -25,6 +44,7 @@ class KubeletAnalyzer:
         self.openai_api_key = openai_api_key or os.getenv('OPENAI_API_KEY')
         self.openai_model = openai_model
         self.openai_enabled = self.openai_api_key is not None
+        self._openai_client = None  # Created on first use, then reused across analyses
     
     def analyze_results(self, scan_results: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -81,8 +101,18 @@ class KubeletAnalyzer:
             Node analysis results
         """
         issues = node.get('issues', [])
-        critical_count = sum(1 for issue in issues if issue.get('severity') == 'CRITICAL')
-        warning_count = sum(1 for issue in issues if issue.get('severity') == 'WARNING')
+        
+        # Use the scanner's severity counts; count in a single pass for older results
+        critical_count = node.get('critical_count')
+        warning_count = node.get('warning_count')
+        if critical_count is None or warning_count is None:
+            critical_count = warning_count = 0
+            for issue in issues:
+                severity = issue.get('severity')
+                if severity == 'CRITICAL':
+                    critical_count += 1
+                elif severity == 'WARNING':
+                    warning_count += 1
         
         if critical_count > 0:
             risk_level = 'high'
@@ -111,19 +141,21 @@ class KubeletAnalyzer:
         """
         recommendations = []
         
-        # Check for anonymous access
+        # Check for anonymous access and readonly port in a single pass
+        has_anonymous = has_readonly = False
         for risk in analysis.get('critical_risks', []):
-            if 'anonymous' in risk.get('issue', '').lower():
-                recommendations.append(
-                    "Disable anonymous authentication on kubelet by setting --anonymous-auth=false"
-                )
+            issue = risk.get('issue', '').lower()
+            has_anonymous = has_anonymous or 'anonymous' in issue
+            has_readonly = has_readonly or 'readonly' in issue
         
-        # Check for readonly port
-        for risk in analysis.get('critical_risks', []):
-            if 'readonly' in risk.get('issue', '').lower():
-                recommendations.append(
-                    "Disable readonly port by setting --read-only-port=0 in kubelet configuration"
-                )
+        if has_anonymous:
+            recommendations.append(
+                "Disable anonymous authentication on kubelet by setting --anonymous-auth=false"
+            )
+        if has_readonly:
+            recommendations.append(
+                "Disable readonly port by setting --read-only-port=0 in kubelet configuration"
+            )
         
         # General recommendations
         if analysis.get('critical_risks'):
@@ -150,9 +182,7 @@ class KubeletAnalyzer:
             AI insights dictionary
         """
         try:
-            from openai import OpenAI
-            
-            client = OpenAI(api_key=self.openai_api_key)
+            client = self._get_openai_client()
             
             # Build prompt
             prompt = self._build_ai_prompt(analysis)
@@ -170,20 +200,51 @@ class KubeletAnalyzer:
                     }
                 ],
                 temperature=0.7,
-                max_tokens=1000
+                max_tokens=1000,
+                stream=True
             )
             
-            ai_text = response.choices[0].message.content
+            # Collect streamed deltas; keeps whatever arrived if the stream breaks early,
+            # flagged as truncated so reports don't pass it off as the full analysis
+            chunks = []
+            truncated = False
+            try:
+                for chunk in response:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        chunks.append(chunk.choices[0].delta.content)
+            except Exception as e:
+                if not chunks:
+                    raise
+                logger.warning(f"AI response stream interrupted, using partial analysis: {e}")
+                truncated = True
+            
+            ai_text = "".join(chunks)
             
             return {
                 'analysis': ai_text,
-                'model': self.openai_model
+                'model': self.openai_model,
+                'truncated': truncated
             }
             
         except Exception as e:
             logger.error(f"Error getting AI insights: {e}")
             return None
     
+    def _get_openai_client(self):
+        """
+        Get the shared OpenAI client, creating it on first use.
+        
+        Reusing one client keeps its HTTP connection pool (and TLS sessions)
+        alive across analyses.
+        
+        Returns:
+            OpenAI client instance
+        """
+        if self._openai_client is None:
+            from openai import OpenAI
+            self._openai_client = OpenAI(api_key=self.openai_api_key)
+        return self._openai_client
+    
     def _build_ai_prompt(self, analysis: Dict[str, Any]) -> str:
         """
         Build prompt for AI analysis.
@@ -194,29 +255,18 @@ class KubeletAnalyzer:
         Returns:
             Prompt string
         """
-        prompt = f"""Analyze the following kubelet security scan results:
-
-Status: {analysis.get('overall_status', 'UNKNOWN')}
-Total Nodes: {analysis.get('summary', {}).get('total_nodes', 0)}
-Nodes with Issues: {analysis.get('summary', {}).get('nodes_with_issues', 0)}
-
-Critical Issues:
-"""
-        for risk in analysis.get('critical_risks', [])[:5]:
-            prompt += f"- {risk.get('issue', 'Unknown issue')}\n"
-        
-        prompt += "\nWarnings:\n"
-        for warning in analysis.get('warnings', [])[:5]:
-            prompt += f"- {warning.get('issue', 'Unknown warning')}\n"
-        
-        prompt += """
-Please provide:
-1. Overall risk assessment with severity
-2. Top 3-5 critical security concerns with business impact
-3. WHY IT'S DANGEROUS - Attack vectors and potential exploits
-4. EXPLANATION - What attackers could do with these vulnerabilities
-5. Prioritized remediation roadmap with time estimates
-"""
+        summary = analysis.get('summary', {})
+        parts = [
+            _PROMPT_HEADER.format(
+                status=analysis.get('overall_status', 'UNKNOWN'),
+                total_nodes=summary.get('total_nodes', 0),
+                nodes_with_issues=summary.get('nodes_with_issues', 0)
+            )
+        ]
+        parts.extend(f"- {risk.get('issue', 'Unknown issue')}\n" for risk in analysis.get('critical_risks', [])[:5])
+        parts.append("\nWarnings:\n")
+        parts.extend(f"- {warning.get('issue', 'Unknown warning')}\n" for warning in analysis.get('warnings', [])[:5])
+        parts.append(_PROMPT_FOOTER)
         
-        return prompt
+        return "".join(parts)
 
@@ -0,0 +1,160 @@
+"""
+Node Cache Module
+
+Keeps an in-memory copy of the cluster's nodes up to date from a Kubernetes watch.
+"""
+
+import logging
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    from kubernetes import watch
+    from kubernetes.client.rest import ApiException
+    KUBERNETES_AVAILABLE = True
+except ImportError:
+    KUBERNETES_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# HTTP status returned when a watch's resourceVersion is too old
+HTTP_GONE = 410
+
+
+def list_all_nodes(v1, page_size: int = 500) -> Tuple[List[Any], Optional[str]]:
+    """
+    List all cluster nodes, paging through the results.
+    
+    Args:
+        v1: Kubernetes CoreV1Api client
+        page_size: Nodes fetched per list_node() page
+    
+    Returns:
+        Tuple of (node objects, resourceVersion of the list)
+    """
+    nodes = []
+    continue_token = None
+    resource_version = None
+    while True:
+        if continue_token:
+            page = v1.list_node(limit=page_size, _continue=continue_token)
+        else:
+            page = v1.list_node(limit=page_size)
+        nodes.extend(page.items)
+        continue_token = page.metadata._continue if page.metadata else None
+        if page.metadata and page.metadata.resource_version:
+            resource_version = page.metadata.resource_version
+        if not continue_token:
+            break
+    return nodes, resource_version
+
+
+class NodeCache:
+    """Maintains a local node map from a background list + watch, so scans read nodes from memory."""
+    
+    # Seconds a single watch request stays open before it is renewed
+    WATCH_TIMEOUT = 300
+    
+    # Seconds to wait before retrying after a watch error
+    RETRY_DELAY = 5
+    
+    def __init__(self, v1, page_size: int = 500):
+        """
+        Initialize the node cache.
+        
+        Args:
+            v1: Kubernetes CoreV1Api client
+            page_size: Nodes fetched per list_node() page when (re-)listing
+        """
+        if not KUBERNETES_AVAILABLE:
+            raise RuntimeError("kubernetes library is required for NodeCache")
+        
+        self.v1 = v1
+        self.page_size = page_size
+        self._nodes: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        self._synced = threading.Event()
+        self._stopped = threading.Event()
+        self._watch = None
+        self._thread = None
+    
+    def start(self) -> None:
+        """Start the background watch thread."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="node-cache", daemon=True)
+        self._thread.start()
+    
+    def stop(self) -> None:
+        """Stop the background watch thread."""
+        self._stopped.set()
+        if self._watch:
+            self._watch.stop()
+    
+    def wait_for_sync(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until the initial node list has been loaded.
+        
+        Args:
+            timeout: Maximum seconds to wait (None waits forever)
+        
+        Returns:
+            True if the cache is synced, False on timeout
+        """
+        return self._synced.wait(timeout)
+    
+    def nodes(self) -> List[Any]:
+        """
+        Get a snapshot of the cached nodes.
+        
+        Returns:
+            List of Kubernetes node objects
+        """
+        with self._lock:
+            return list(self._nodes.values())
+    
+    def _relist(self) -> Optional[str]:
+        """Replace the cache contents with a fresh node list and return its resourceVersion."""
+        nodes, resource_version = list_all_nodes(self.v1, self.page_size)
+        with self._lock:
+            self._nodes = {node.metadata.name: node for node in nodes}
+        self._synced.set()
+        logger.info(f"Node cache synced with {len(nodes)} nodes")
+        return resource_version
+    
+    def _run(self) -> None:
+        """List nodes, then apply watch events until stopped."""
+        resource_version = None
+        while not self._stopped.is_set():
+            try:
+                if resource_version is None:
+                    resource_version = self._relist()
+                
+                self._watch = watch.Watch()
+                for event in self._watch.stream(self.v1.list_node,
+                                                resource_version=resource_version,
+                                                timeout_seconds=self.WATCH_TIMEOUT):
+                    node = event['object']
+                    with self._lock:
+                        if event['type'] == 'DELETED':
+                            self._nodes.pop(node.metadata.name, None)
+                        else:
+                            self._nodes[node.metadata.name] = node
+                    resource_version = node.metadata.resource_version
+                    
+                    if self._stopped.is_set():
+                        break
+            
+            except ApiException as e:
+                if e.status == HTTP_GONE:
+                    # Our resourceVersion is too old; start over from a fresh list
+                    logger.info("Node watch expired, re-listing nodes")
+                    resource_version = None
+                else:
+                    logger.warning(f"Node watch API error: {e}")
+                    self._stopped.wait(self.RETRY_DELAY)
+            except Exception as e:
+                logger.warning(f"Node watch error: {e}")
+                resource_version = None
+                self._stopped.wait(self.RETRY_DELAY)
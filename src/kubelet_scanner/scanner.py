@@ -4,18 +4,33 @@ Kubelet Scanner Module
 Scans Kubernetes cluster for kubelet security configuration issues.
 """
 
-import os
 import json
+import asyncio
 import logging
-import subprocess
+import socket
+import sys
+import threading
+import time
 import requests
-from typing import Dict, Any, List, Optional
-from datetime import datetime
-from urllib.parse import urlparse
+from requests.adapters import HTTPAdapter
+from collections import Counter
+from functools import lru_cache
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
+from datetime import datetime, timezone
 import urllib3
 
-# Disable SSL warnings for kubelet (uses self-signed certs)
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 try:
     from kubernetes import client, config
@@ -26,9 +41,151 @@ except ImportError as e:
     logger = logging.getLogger(__name__)
     logger.warning(f"kubernetes library not available: {e}. Install with: pip install kubernetes")
 
+from .node_cache import NodeCache, list_all_nodes
+
 logger = logging.getLogger(__name__)
 
 
+def _parse_version(version: str) -> Optional[Tuple[int, ...]]:
+    """
+    Parse a version string into a tuple that compares correctly with '<'.
+    
+    Trailing zero components are dropped so '1.28' and '1.28.0' compare equal.
+    
+    Args:
+        version: Version string (e.g., 'v1.28.0')
+    
+    Returns:
+        Tuple of version components, or None if the version can't be parsed
+    """
+    try:
+        parts = [int(x) for x in version.lstrip('v').split('.')]
+    except ValueError:
+        logger.debug(f"Could not parse version {version}")
+        return None
+    
+    while len(parts) > 1 and parts[-1] == 0:
+        parts.pop()
+    return tuple(parts)
+
+
+# Known critical CVEs (simplified - in production, use a CVE database)
+# This is just an example - you'd want to maintain a proper CVE database
+# Entries are (cve_id, severity, affected_versions, parsed upper bound), sorted
+# by upper bound, highest first, so a lookup can stop at the first bound the
+# version is not below
+_CRITICAL_CVES = sorted(
+    [
+        (cve_id, severity, affected, _parse_version(affected[1:]))
+        for cve_id, severity, affected in [
+            ('CVE-2023-5528', 'HIGH', '<1.28.0'),
+            ('CVE-2023-5529', 'HIGH', '<1.27.4'),
+            ('CVE-2023-3978', 'CRITICAL', '<1.27.3'),
+        ]
+    ],
+    key=lambda cve: cve[3],
+    reverse=True
+)
+
+@lru_cache(maxsize=64)
+def _cve_lookup(version: str) -> Dict[str, Any]:
+    """
+    Check a kubelet version against the known CVE table (cached per version).
+    
+    Args:
+        version: Kubelet version string (e.g., 'v1.28.0')
+    
+    Returns:
+        Dictionary with vulnerability information
+    """
+    vulnerabilities = {
+        'version': version,
+        'known_vulnerabilities': [],
+        'is_vulnerable': False,
+        'recommendation': None
+    }
+    
+    # Extract version number (e.g., 'v1.28.0' -> '1.28.0')
+    version_num = version.lstrip('v') if version else None
+    
+    if not version_num:
+        vulnerabilities['error'] = 'Could not parse version'
+        return vulnerabilities
+    
+    # Check against known CVEs (simplified version comparison)
+    # In production, use proper semantic versioning library
+    version_key = _parse_version(version_num)
+    if version_key is not None:
+        for cve_id, severity, affected, cutoff in _CRITICAL_CVES:
+            if not version_key < cutoff:
+                # Every remaining CVE has a lower bound, so none of them apply
+                break
+            vulnerabilities['known_vulnerabilities'].append({
+                'cve': cve_id,
+                'severity': severity,
+                'affected_version': affected
+            })
+            vulnerabilities['is_vulnerable'] = True
+    
+    if vulnerabilities['is_vulnerable']:
+        vulnerabilities['recommendation'] = f"Upgrade kubelet to the latest patched version. Current version {version} has known vulnerabilities."
+    else:
+        vulnerabilities['recommendation'] = f"Version {version} appears to be secure, but always keep kubelet updated to the latest version."
+    
+    return vulnerabilities
+
+
+# Substrings that mark an annotation key as kubelet-related
+_KUBELET_ANNOTATION_MARKERS = ('kubelet', 'anonymous')
+
+# Static parts of the issues/passed checks reported per node. Only the
+# description varies between nodes, so it is filled in from a template.
+_ANONYMOUS_AUTH_DESC = "Anonymous authentication enabled on kubelet port {port}. Port is accessible without authentication."
+_AUTH_REQUIRED_DESC = "Kubelet port {port} requires authentication (anonymous access disabled)"
+_READONLY_PORT_DESC = "Readonly port {port} is accessible. This port should be disabled (set --read-only-port=0)"
+_READONLY_CLOSED_DESC = "Readonly port {port} is disabled (closed)"
+
+_ISSUE_ANONYMOUS_AUTH = {
+    'severity': 'CRITICAL',
+    'type': 'anonymous_access_enabled',
+    'description': None,  # Filled in per node
+    'recommendation': 'Disable anonymous authentication by setting --anonymous-auth=false in kubelet configuration'
+}
+_ISSUE_READONLY_PORT = {
+    'severity': 'CRITICAL',
+    'type': 'readonly_port_enabled',
+    'description': None,  # Filled in per node
+    'recommendation': 'Disable readonly port by setting --read-only-port=0 in kubelet configuration'
+}
+_ISSUE_AUTHZ_ALWAYSALLOW = {
+    'severity': 'CRITICAL',
+    'type': 'authorization_mode_alwaysallow',
+    'description': 'Authorization mode may be set to AlwaysAllow (inferred from anonymous access)',
+    'recommendation': 'Set --authorization-mode to Webhook or RBAC, not AlwaysAllow'
+}
+_ISSUE_METRICS_ACCESSIBLE = {
+    'severity': 'CRITICAL',
+    'type': 'metrics_endpoint_accessible',
+    'description': 'Metrics endpoint is accessible without authentication. This exposes sensitive metrics data.',
+    'recommendation': 'Restrict access to /metrics endpoint or ensure authentication is required'
+}
+_PASSED_AUTHZ_SECURE = {
+    'check': 'authorization_mode_secure',
+    'description': 'Authorization mode appears to be secure (not AlwaysAllow, authentication required)',
+    'status': 'PASSED'
+}
+_PASSED_METRICS_AUTH = {
+    'check': 'metrics_endpoint_secured',
+    'description': 'Metrics endpoint requires authentication (not accessible anonymously)',
+    'status': 'PASSED'
+}
+_PASSED_METRICS_CLOSED = {
+    'check': 'metrics_endpoint_secured',
+    'description': 'Metrics endpoint is not accessible (properly secured)',
+    'status': 'PASSED'
+}
+
+
 class KubeletScanner:
     """Scans Kubernetes cluster for kubelet security configuration issues."""
     
@@ -36,9 +193,72 @@ class KubeletScanner:
     DEFAULT_KUBELET_PORT = 10250
     DEFAULT_READONLY_PORT = 10255
     
-    def __init__(self):
-        """Initialize the kubelet scanner."""
+    # Default upper bound on concurrent node scans (probes are network-bound),
+    # for both the thread pool and the asyncio path
+    MAX_SCAN_WORKERS = 64
+    
+    # Connection limits on the asyncio path, so kubelets aren't overwhelmed;
+    # each node scan holds up to two connections per host
+    MAX_CONNECTIONS = 200
+    MAX_CONNECTIONS_PER_HOST = 4
+    
+    # Timeout (seconds) for the TCP reachability check on kubelet ports
+    CONNECT_TIMEOUT = 1.0
+    
+    # Timeout (seconds) for kubelet HTTP(S) probes
+    PROBE_TIMEOUT = 5
+    
+    # Connect/read timeouts (seconds) for the /healthz anonymous access probe
+    HEALTHZ_CONNECT_TIMEOUT = 1.0
+    HEALTHZ_READ_TIMEOUT = 2.0
+    
+    # Nodes fetched per list_node() page
+    NODE_LIST_PAGE_SIZE = 500
+    
+    # How long (seconds) a node list is reused before re-listing from the API server
+    DEFAULT_NODE_CACHE_TTL = 60
+    
+    # Seconds to wait for the node watch cache's initial list before falling back to listing
+    NODE_CACHE_SYNC_TIMEOUT = 30
+    
+    def __init__(self, node_cache_ttl: float = DEFAULT_NODE_CACHE_TTL, watch_nodes: bool = False,
+                 node_name: Optional[str] = None, scan_concurrency: int = MAX_SCAN_WORKERS):
+        """
+        Initialize the kubelet scanner.
+        
+        Args:
+            node_cache_ttl: Seconds to reuse a node list between scans (0 disables caching)
+            watch_nodes: Keep nodes in a watch-backed cache (for long-running processes that scan repeatedly)
+            node_name: Only scan this node (e.g. the local node from the Downward API in per-node deployments)
+            scan_concurrency: Maximum number of nodes scanned at once
+        """
         self.v1 = None
+        self.scan_concurrency = max(1, scan_concurrency)
+        self.node_name = node_name
+        self._node_watcher: Optional[NodeCache] = None
+        self.node_cache_ttl = node_cache_ttl
+        self._node_cache: Optional[Tuple[float, List[Any]]] = None
+        self._node_cache_lock = threading.Lock()
+        
+        # In-flight/completed probes for the current scan, keyed by (ip, port) or
+        # (ip, port, endpoint), so nodes sharing an IP are only probed once
+        self._probes: Dict[Tuple[Any, ...], Any] = {}
+        self._probes_lock = threading.Lock()
+        
+        # Shared HTTP session so probes reuse pooled connections
+        self._session = requests.Session()
+        self._session.verify = False  # Kubelet uses self-signed certs
+        # urllib3 warns on every unverified HTTPS request; silence it once the
+        # scanner is actually in use rather than as a side effect of importing
+        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+        # Don't let REQUESTS_CA_BUNDLE/proxy env vars override verify for node probes
+        self._session.trust_env = False
+        adapter = HTTPAdapter(
+            pool_connections=self.scan_concurrency,
+            pool_maxsize=self.scan_concurrency * 2
+        )
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
         
         if KUBERNETES_AVAILABLE:
             try:
@@ -50,10 +270,27 @@ class KubeletScanner:
                     config.load_kube_config()
                     logger.info("Loaded kubeconfig")
                 
-                self.v1 = client.CoreV1Api()
+                # The Python client only decodes JSON, so negotiate compression
+                # instead of protobuf to cut the size of large node lists. The
+                # header goes on a dedicated API client: the node watch reads its
+                # stream raw, line by line, and can't handle a gzipped body.
+                api_client = client.ApiClient()
+                api_client.set_default_header('Accept-Encoding', 'gzip')
+                self.v1 = client.CoreV1Api(api_client)
             except Exception as e:
                 logger.error(f"Failed to initialize Kubernetes client: {e}")
                 raise
+            
+            if watch_nodes and not node_name:
+                # A plain client, without the gzip header
+                self._node_watcher = NodeCache(client.CoreV1Api(), self.NODE_LIST_PAGE_SIZE)
+                self._node_watcher.start()
+    
+    def close(self) -> None:
+        """Stop the node watch (if any) and close pooled kubelet probe connections."""
+        if self._node_watcher:
+            self._node_watcher.stop()
+        self._session.close()
     
     def scan_kubelet_config(self) -> Dict[str, Any]:
         """
@@ -63,7 +300,7 @@ class KubeletScanner:
             Dictionary containing scan results
         """
         results = {
-            'scan_time': datetime.utcnow().isoformat(),
+            'scan_time': datetime.now(timezone.utc).isoformat(timespec='seconds'),
             'nodes': [],
             'summary': {
                 'total_nodes': 0,
@@ -81,37 +318,54 @@ class KubeletScanner:
         
         try:
             # Get all nodes
-            nodes = self.v1.list_node()
-            results['summary']['total_nodes'] = len(nodes.items)
+            nodes = self._list_nodes()
+            self._probes = {}
+            results['summary']['total_nodes'] = len(nodes)
+            
+            logger.info(f"Scanning {len(nodes)} nodes for kubelet security issues...")
+            
+            # Scan nodes concurrently; each scan is dominated by probe timeouts
+            if nodes and AIOHTTP_AVAILABLE:
+                results['nodes'] = asyncio.run(self._scan_nodes_async(nodes))
+            elif nodes:
+                max_workers = min(self.scan_concurrency, len(nodes))
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    results['nodes'] = list(executor.map(self._scan_node, nodes))
             
-            logger.info(f"Scanning {len(nodes.items)} nodes for kubelet security issues...")
+            summary = results['summary']
+            critical_issues = summary['critical_issues']
+            warnings = summary['warnings']
+            passed_checks = summary['passed_checks']
             
-            for node in nodes.items:
-                node_info = self._scan_node(node)
-                results['nodes'].append(node_info)
+            for node_info in results['nodes']:
+                # Node names repeat in every summary entry; share one string object
+                node_name = node_info['name'] = sys.intern(node_info['name'])
                 
-                # Update summary
-                if node_info.get('issues'):
-                    results['summary']['nodes_with_issues'] += 1
-                    for issue in node_info['issues']:
-                        if issue.get('severity') == 'CRITICAL':
-                            results['summary']['critical_issues'].append({
-                                'node': node_info['name'],
-                                'issue': issue['description']
-                            })
-                        elif issue.get('severity') == 'WARNING':
-                            results['summary']['warnings'].append({
-                                'node': node_info['name'],
-                                'issue': issue['description']
-                            })
+                # Update summary, skipping severities the node has no issues for
+                issues = node_info.get('issues')
+                if issues:
+                    summary['nodes_with_issues'] += 1
+                    if node_info.get('critical_count', 1):
+                        critical_issues.extend(
+                            {'node': node_name, 'issue': issue['description']}
+                            for issue in issues if issue.get('severity') == 'CRITICAL'
+                        )
+                    if node_info.get('warning_count', 1):
+                        warnings.extend(
+                            {'node': node_name, 'issue': issue['description']}
+                            for issue in issues if issue.get('severity') == 'WARNING'
+                        )
                 
-                # Aggregate passed checks
-                for check in node_info.get('passed_checks', []):
-                    results['summary']['passed_checks'].append({
-                        'node': node_info['name'],
+                # Aggregate passed checks (a node passes each check at most once, so every
+                # (check, description) pair lists a node only once)
+                passed_checks.extend(
+                    {
+                        'node': node_name,
                         'check': check.get('check'),
                         'description': check.get('description')
-                    })
+                    }
+                    for check in node_info.get('passed_checks', [])
+                )
             
             # Calculate overall status
             if results['summary']['critical_issues']:
@@ -130,10 +384,129 @@ class KubeletScanner:
         
         return results
     
+    def _list_nodes(self) -> List[Any]:
+        """
+        List cluster nodes (or just the configured node), reusing a recent result within the cache TTL.
+        
+        Returns:
+            List of Kubernetes node objects
+        """
+        # Serve from the watch-backed cache once it has synced
+        if self._node_watcher and self._node_watcher.wait_for_sync(self.NODE_CACHE_SYNC_TIMEOUT):
+            return self._node_watcher.nodes()
+        
+        with self._node_cache_lock:
+            if self._node_cache and time.monotonic() - self._node_cache[0] < self.node_cache_ttl:
+                logger.debug("Using cached node list")
+                return self._node_cache[1]
+            
+            if self.node_name:
+                # Per-node deployments only need their own node: a keyed GET instead of a LIST
+                logger.info(f"🎯 Scan limited to node {self.node_name} (SCAN_NODE_NAME); other nodes are not scanned")
+                nodes = [self.v1.read_node(name=self.node_name)]
+            else:
+                # Page through the list so large clusters aren't fetched in one huge response
+                nodes, _ = list_all_nodes(self.v1, self.NODE_LIST_PAGE_SIZE)
+            self._node_cache = (time.monotonic(), nodes)
+            return nodes
+    
+    async def _scan_nodes_async(self, nodes: List[Any]) -> List[Dict[str, Any]]:
+        """
+        Scan all nodes concurrently on a single asyncio event loop.
+        
+        Args:
+            nodes: Kubernetes node objects
+        
+        Returns:
+            List of node scan results, in the same order as nodes
+        """
+        semaphore = asyncio.Semaphore(self.scan_concurrency)
+        connector = aiohttp.TCPConnector(
+            limit=self.MAX_CONNECTIONS,
+            limit_per_host=self.MAX_CONNECTIONS_PER_HOST,
+            ssl=False  # Kubelet uses self-signed certs
+        )
+        timeout = aiohttp.ClientTimeout(total=self.PROBE_TIMEOUT)
+        
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            async def scan(node):
+                async with semaphore:
+                    return await self._scan_node_async(session, node)
+            
+            return await asyncio.gather(*(scan(node) for node in nodes))
+    
     def _scan_node(self, node) -> Dict[str, Any]:
         """
         Scan a single node for kubelet security issues.
         
+        Args:
+            node: Kubernetes node object
+        
+        Returns:
+            Dictionary with node scan results
+        """
+        node_info = self._build_node_info(node)
+        
+        # Check kubelet ports, then endpoints (reusing the pooled kubelet port connection)
+        if not self._is_node_ready(node):
+            node_info['port_checks'] = self._skipped_port_checks(node_info['name'])
+        elif node_info['ip']:
+            node_info['port_checks'] = self._check_kubelet_ports(node_info['ip'])
+            node_info['endpoint_checks'] = self._check_kubelet_endpoints(node_info['ip'])
+        
+        return self._finish_node_info(node_info)
+    
+    async def _scan_node_async(self, session: 'aiohttp.ClientSession', node) -> Dict[str, Any]:
+        """
+        Scan a single node for kubelet security issues using asyncio probes.
+        
+        Args:
+            session: Shared aiohttp session for kubelet probes
+            node: Kubernetes node object
+        
+        Returns:
+            Dictionary with node scan results
+        """
+        node_info = self._build_node_info(node)
+        
+        # Check kubelet ports and endpoints together. The /metrics probe waits on
+        # the shared kubelet port probe, so it starts as soon as /healthz is done
+        # (reusing its pooled TLS connection) while the read-only port is still probed
+        if not self._is_node_ready(node):
+            node_info['port_checks'] = self._skipped_port_checks(node_info['name'])
+        elif node_info['ip']:
+            node_info['port_checks'], node_info['endpoint_checks'] = await asyncio.gather(
+                self._check_kubelet_ports_async(session, node_info['ip']),
+                self._check_kubelet_endpoints_async(session, node_info['ip'])
+            )
+        
+        return self._finish_node_info(node_info)
+    
+    def _is_node_ready(self, node) -> bool:
+        """
+        Check whether a node's Ready condition allows probing its kubelet.
+        
+        Args:
+            node: Kubernetes node object
+        
+        Returns:
+            False if the node reports Ready as False or Unknown, True otherwise
+        """
+        for condition in node.status.conditions or []:
+            if condition.type == 'Ready':
+                return condition.status == 'True'
+        return True
+    
+    def _skipped_port_checks(self, node_name: str) -> Dict[str, Any]:
+        """Return port check results for a node whose probes were skipped because it is NotReady."""
+        # Probes against a NotReady kubelet almost always just run into timeouts
+        logger.info(f"⏭️  Skipping kubelet probes on NotReady node {node_name}")
+        return {'skipped': True, 'reason': 'NotReady'}
+    
+    def _build_node_info(self, node) -> Dict[str, Any]:
+        """
+        Build the initial node scan results from the node object (no network access).
+        
         Args:
             node: Kubernetes node object
         
@@ -167,11 +540,18 @@ class KubeletScanner:
         # Check kubelet configuration from node status
         node_info['kubelet_config'] = self._check_kubelet_config(node)
         
-        # Check kubelet ports
-        if node_info['ip']:
-            node_info['port_checks'] = self._check_kubelet_ports(node_info['ip'])
-            node_info['endpoint_checks'] = self._check_kubelet_endpoints(node_info['ip'])
+        return node_info
+    
+    def _finish_node_info(self, node_info: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Add version vulnerabilities and compiled issues to probed node scan results.
+        
+        Args:
+            node_info: Node scan information with port/endpoint checks filled in
         
+        Returns:
+            Dictionary with node scan results
+        """
         # Check version vulnerabilities
         if node_info['kubelet_version']:
             node_info['version_vulnerabilities'] = self._check_version_vulnerabilities(node_info['kubelet_version'])
@@ -181,6 +561,11 @@ class KubeletScanner:
         node_info['issues'] = compiled.get('issues', [])
         node_info['passed_checks'] = compiled.get('passed_checks', [])
         
+        # Record severity counts so the analyzer doesn't re-scan the issues
+        severity_counts = Counter(issue.get('severity') for issue in node_info['issues'])
+        node_info['critical_count'] = severity_counts['CRITICAL']
+        node_info['warning_count'] = severity_counts['WARNING']
+        
         return node_info
     
     def _extract_kubelet_version(self, node) -> Optional[str]:
@@ -221,14 +606,16 @@ class KubeletScanner:
             'source': 'node_annotations'  # Where we got the info from
         }
         
-        # Check node annotations for kubelet configuration
-        annotations = node.metadata.annotations or {}
-        
-        # Try to find kubelet configuration in annotations
+        # Kubelet-related annotations don't feed any checks yet; list them
+        # for debugging only, so skip the scan entirely otherwise
         # Note: This may not always be available, depends on cluster setup
-        for key, value in annotations.items():
-            if 'kubelet' in key.lower() or 'anonymous' in key.lower():
-                logger.debug(f"Found kubelet annotation: {key} = {value}")
+        if logger.isEnabledFor(logging.DEBUG) and node.metadata.annotations:
+            kubelet_keys = [
+                key for key in node.metadata.annotations
+                if any(marker in key.lower() for marker in _KUBELET_ANNOTATION_MARKERS)
+            ]
+            if kubelet_keys:
+                logger.debug(f"Kubelet-related annotations on {node.metadata.name}: {kubelet_keys}")
         
         # For now, we'll rely on port checks to infer configuration
         # In a real scenario, you might need to:
@@ -248,7 +635,40 @@ class KubeletScanner:
         Returns:
             Dictionary with port check results
         """
-        port_checks = {
+        port_checks = self._new_port_checks()
+        
+        # Check default kubelet port (10250) and readonly port (10255); nodes are
+        # already scanned in parallel, and the TCP pre-check keeps a closed port cheap
+        port_checks['default_port'].update(self._test_kubelet_port(node_ip, self.DEFAULT_KUBELET_PORT))
+        port_checks['readonly_port'].update(self._test_kubelet_port(node_ip, self.DEFAULT_READONLY_PORT))
+        
+        return port_checks
+    
+    async def _check_kubelet_ports_async(self, session: 'aiohttp.ClientSession', node_ip: str) -> Dict[str, Any]:
+        """
+        Check if kubelet ports are accessible using asyncio probes.
+        
+        Args:
+            session: Shared aiohttp session for kubelet probes
+            node_ip: Node IP address
+        
+        Returns:
+            Dictionary with port check results
+        """
+        port_checks = self._new_port_checks()
+        
+        default_result, readonly_result = await asyncio.gather(
+            self._test_kubelet_port_async(session, node_ip, self.DEFAULT_KUBELET_PORT),
+            self._test_kubelet_port_async(session, node_ip, self.DEFAULT_READONLY_PORT)
+        )
+        port_checks['default_port'].update(default_result)
+        port_checks['readonly_port'].update(readonly_result)
+        
+        return port_checks
+    
+    def _new_port_checks(self) -> Dict[str, Any]:
+        """Return port check results with every port marked not accessible."""
+        return {
             'default_port': {
                 'port': self.DEFAULT_KUBELET_PORT,
                 'accessible': False,
@@ -261,28 +681,47 @@ class KubeletScanner:
                 'error': None
             }
         }
+    
+    def _check_kubelet_endpoints(self, node_ip: str) -> Dict[str, Any]:
+        """
+        Check kubelet endpoints for security issues.
         
-        # Check default kubelet port (10250)
-        default_result = self._test_kubelet_port(node_ip, self.DEFAULT_KUBELET_PORT)
-        port_checks['default_port'].update(default_result)
+        Args:
+            node_ip: Node IP address
         
-        # Check readonly port (10255)
-        readonly_result = self._test_kubelet_port(node_ip, self.DEFAULT_READONLY_PORT)
-        port_checks['readonly_port'].update(readonly_result)
+        Returns:
+            Dictionary with endpoint check results
+        """
+        endpoint_checks = self._new_endpoint_checks()
         
-        return port_checks
+        # Check metrics endpoint (should not be accessible without auth)
+        metrics_result = self._test_kubelet_endpoint(node_ip, self.DEFAULT_KUBELET_PORT, '/metrics')
+        endpoint_checks['metrics'].update(metrics_result)
+        
+        return endpoint_checks
     
-    def _check_kubelet_endpoints(self, node_ip: str) -> Dict[str, Any]:
+    async def _check_kubelet_endpoints_async(self, session: 'aiohttp.ClientSession', node_ip: str) -> Dict[str, Any]:
         """
-        Check kubelet endpoints for security issues.
+        Check kubelet endpoints for security issues using asyncio probes.
         
         Args:
+            session: Shared aiohttp session for kubelet probes
             node_ip: Node IP address
         
         Returns:
             Dictionary with endpoint check results
         """
-        endpoint_checks = {
+        endpoint_checks = self._new_endpoint_checks()
+        
+        # Check metrics endpoint (should not be accessible without auth)
+        metrics_result = await self._test_kubelet_endpoint_async(session, node_ip, self.DEFAULT_KUBELET_PORT, '/metrics')
+        endpoint_checks['metrics'].update(metrics_result)
+        
+        return endpoint_checks
+    
+    def _new_endpoint_checks(self) -> Dict[str, Any]:
+        """Return endpoint check results with every endpoint marked not accessible."""
+        return {
             'metrics': {
                 'endpoint': '/metrics',
                 'accessible': False,
@@ -291,14 +730,23 @@ class KubeletScanner:
                 'error': None
             }
         }
+    
+    def _test_kubelet_endpoint(self, node_ip: str, port: int, endpoint: str) -> Dict[str, Any]:
+        """
+        Test a kubelet endpoint, sharing one probe between callers for the same (ip, port, endpoint) in a scan.
         
-        # Check metrics endpoint (should not be accessible without auth)
-        metrics_result = self._test_kubelet_endpoint(node_ip, self.DEFAULT_KUBELET_PORT, '/metrics')
-        endpoint_checks['metrics'].update(metrics_result)
+        Args:
+            node_ip: Node IP address
+            port: Port number
+            endpoint: Endpoint path (e.g., '/metrics')
         
-        return endpoint_checks
+        Returns:
+            Dictionary with test results
+        """
+        return self._shared_probe((node_ip, port, endpoint), self._probe_kubelet_endpoint,
+                                  node_ip, port, endpoint)
     
-    def _test_kubelet_endpoint(self, node_ip: str, port: int, endpoint: str) -> Dict[str, Any]:
+    def _probe_kubelet_endpoint(self, node_ip: str, port: int, endpoint: str) -> Dict[str, Any]:
         """
         Test if a kubelet endpoint is accessible.
         
@@ -317,13 +765,18 @@ class KubeletScanner:
             'error': None
         }
         
+        # Skip the TLS request when the TCP probe already found the port closed
+        if not self._test_kubelet_port(node_ip, port)['accessible']:
+            result['error'] = 'Connection refused or endpoint not accessible'
+            logger.debug("Endpoint %s not accessible on %s:%s (port closed)", endpoint, node_ip, port)
+            return result
+        
         url = f"https://{node_ip}:{port}{endpoint}"
         
         try:
-            response = requests.get(
+            response = self._session.get(
                 url,
-                verify=False,  # Kubelet uses self-signed certs
-                timeout=5,
+                timeout=self.PROBE_TIMEOUT,
                 allow_redirects=False
             )
             
@@ -339,16 +792,90 @@ class KubeletScanner:
             # SSL error might mean the endpoint is open but requires proper cert
             result['accessible'] = True
             result['error'] = 'SSL verification failed (expected for kubelet)'
-            logger.debug(f"SSL error on {node_ip}:{port}{endpoint} (may be expected)")
+            logger.debug("SSL error on %s:%s%s (may be expected)", node_ip, port, endpoint)
         except requests.exceptions.ConnectionError:
             result['error'] = 'Connection refused or endpoint not accessible'
-            logger.debug(f"Endpoint {endpoint} not accessible on {node_ip}:{port}")
+            logger.debug("Endpoint %s not accessible on %s:%s", endpoint, node_ip, port)
         except requests.exceptions.Timeout:
             result['error'] = 'Connection timeout'
-            logger.debug(f"Timeout connecting to {node_ip}:{port}{endpoint}")
+            logger.debug("Timeout connecting to %s:%s%s", node_ip, port, endpoint)
+        except Exception as e:
+            result['error'] = str(e)
+            logger.debug("Error testing %s:%s%s: %s", node_ip, port, endpoint, e)
+        
+        return result
+    
+    async def _test_kubelet_endpoint_async(self, session: 'aiohttp.ClientSession', node_ip: str,
+                                           port: int, endpoint: str) -> Dict[str, Any]:
+        """
+        Test a kubelet endpoint using asyncio, sharing one probe between callers for the same (ip, port, endpoint) in a scan.
+        
+        Args:
+            session: Shared aiohttp session for kubelet probes
+            node_ip: Node IP address
+            port: Port number
+            endpoint: Endpoint path (e.g., '/metrics')
+        
+        Returns:
+            Dictionary with test results
+        """
+        return await self._shared_probe_async((node_ip, port, endpoint), self._probe_kubelet_endpoint_async,
+                                              session, node_ip, port, endpoint)
+    
+    async def _probe_kubelet_endpoint_async(self, session: 'aiohttp.ClientSession', node_ip: str,
+                                            port: int, endpoint: str) -> Dict[str, Any]:
+        """
+        Test if a kubelet endpoint is accessible using an asyncio probe.
+        
+        Args:
+            session: Shared aiohttp session for kubelet probes
+            node_ip: Node IP address
+            port: Port number
+            endpoint: Endpoint path (e.g., '/metrics')
+        
+        Returns:
+            Dictionary with test results
+        """
+        result = {
+            'accessible': False,
+            'anonymous_access': False,
+            'status_code': None,
+            'error': None
+        }
+        
+        # Skip the TLS request when the TCP probe already found the port closed
+        port_result = await self._test_kubelet_port_async(session, node_ip, port)
+        if not port_result['accessible']:
+            result['error'] = 'Connection refused or endpoint not accessible'
+            logger.debug("Endpoint %s not accessible on %s:%s (port closed)", endpoint, node_ip, port)
+            return result
+        
+        url = f"https://{node_ip}:{port}{endpoint}"
+        
+        try:
+            async with session.get(url, allow_redirects=False) as response:
+                result['accessible'] = True
+                result['status_code'] = response.status
+                
+                # If we get 200 OK without auth, anonymous access is enabled
+                if response.status == 200:
+                    result['anonymous_access'] = True
+                    logger.warning(f"⚠️  Anonymous access to {endpoint} enabled on {node_ip}:{port}")
+            
+        except aiohttp.ClientSSLError:
+            # SSL error might mean the endpoint is open but requires proper cert
+            result['accessible'] = True
+            result['error'] = 'SSL verification failed (expected for kubelet)'
+            logger.debug("SSL error on %s:%s%s (may be expected)", node_ip, port, endpoint)
+        except aiohttp.ClientConnectionError:
+            result['error'] = 'Connection refused or endpoint not accessible'
+            logger.debug("Endpoint %s not accessible on %s:%s", endpoint, node_ip, port)
+        except asyncio.TimeoutError:
+            result['error'] = 'Connection timeout'
+            logger.debug("Timeout connecting to %s:%s%s", node_ip, port, endpoint)
         except Exception as e:
             result['error'] = str(e)
-            logger.debug(f"Error testing {node_ip}:{port}{endpoint}: {e}")
+            logger.debug("Error testing %s:%s%s: %s", node_ip, port, endpoint, e)
         
         return result
     
@@ -365,88 +892,165 @@ class KubeletScanner:
         Returns:
             Dictionary with vulnerability information
         """
-        vulnerabilities = {
-            'version': version,
-            'known_vulnerabilities': [],
-            'is_vulnerable': False,
-            'recommendation': None
+        # Nodes in a cluster mostly share a version, so evaluate each version once;
+        # copy the cached result so callers can't mutate it
+        cached = _cve_lookup(version)
+        return {
+            **cached,
+            'known_vulnerabilities': [dict(vuln) for vuln in cached['known_vulnerabilities']]
         }
+    
+    def _test_kubelet_port(self, node_ip: str, port: int) -> Dict[str, Any]:
+        """
+        Test a kubelet port, sharing one probe between callers for the same (ip, port) in a scan.
         
-        # Known critical CVEs (simplified - in production, use a CVE database)
-        # This is just an example - you'd want to maintain a proper CVE database
-        critical_cves = {
-            'CVE-2023-5528': {'affected_versions': ['<1.28.0'], 'severity': 'HIGH'},
-            'CVE-2023-5529': {'affected_versions': ['<1.27.4'], 'severity': 'HIGH'},
-            'CVE-2023-3978': {'affected_versions': ['<1.27.3'], 'severity': 'CRITICAL'},
-        }
+        Args:
+            node_ip: Node IP address
+            port: Port number to test
+        
+        Returns:
+            Dictionary with test results
+        """
+        return self._shared_probe((node_ip, port), self._probe_kubelet_port, node_ip, port)
+    
+    def _shared_probe(self, key: Tuple[Any, ...], probe, *args) -> Dict[str, Any]:
+        """
+        Run a probe once per key in a scan; concurrent and later callers share its result.
+        
+        Args:
+            key: Probe identity, e.g. (ip, port)
+            probe: Probe function to call
+            *args: Arguments for the probe function
         
-        # Extract version number (e.g., 'v1.28.0' -> '1.28.0')
-        version_num = version.lstrip('v') if version else None
-        
-        if not version_num:
-            vulnerabilities['error'] = 'Could not parse version'
-            return vulnerabilities
-        
-        # Check against known CVEs (simplified version comparison)
-        # In production, use proper semantic versioning library
-        for cve_id, cve_info in critical_cves.items():
-            for affected in cve_info['affected_versions']:
-                if affected.startswith('<'):
-                    # Compare versions (simplified)
-                    affected_version = affected[1:].lstrip('v')
-                    if self._compare_versions(version_num, affected_version) < 0:
-                        vulnerabilities['known_vulnerabilities'].append({
-                            'cve': cve_id,
-                            'severity': cve_info['severity'],
-                            'affected_version': affected
-                        })
-                        vulnerabilities['is_vulnerable'] = True
-        
-        if vulnerabilities['is_vulnerable']:
-            vulnerabilities['recommendation'] = f"Upgrade kubelet to the latest patched version. Current version {version} has known vulnerabilities."
+        Returns:
+            Dictionary with the probe's results
+        """
+        with self._probes_lock:
+            future = self._probes.get(key)
+            owner = future is None
+            if owner:
+                future = self._probes[key] = Future()
+        
+        if owner:
+            try:
+                future.set_result(probe(*args))
+            except Exception as e:
+                future.set_exception(e)
         else:
-            vulnerabilities['recommendation'] = f"Version {version} appears to be secure, but always keep kubelet updated to the latest version."
+            logger.debug("Reusing probe result for %s", key)
         
-        return vulnerabilities
+        return future.result()
     
-    def _compare_versions(self, v1: str, v2: str) -> int:
+    def _probe_kubelet_port(self, node_ip: str, port: int) -> Dict[str, Any]:
         """
-        Compare two version strings.
+        Test if a kubelet port is accessible and if anonymous access is enabled.
         
         Args:
-            v1: First version string
-            v2: Second version string
+            node_ip: Node IP address
+            port: Port number to test
         
         Returns:
-            -1 if v1 < v2, 0 if v1 == v2, 1 if v1 > v2
+            Dictionary with test results
         """
+        result = {
+            'accessible': False,
+            'anonymous_access': False,
+            'status_code': None,
+            'error': None
+        }
+        
+        # Cheap TCP reachability check before paying for an HTTP(S) round trip
+        try:
+            with socket.create_connection((node_ip, port), timeout=self.CONNECT_TIMEOUT):
+                result['accessible'] = True
+        except socket.timeout:
+            result['error'] = 'Connection timeout'
+            logger.debug("Timeout connecting to %s:%s", node_ip, port)
+            return result
+        except OSError:
+            result['error'] = 'Connection refused or port closed'
+            logger.debug("Port %s not accessible on %s", port, node_ip)
+            return result
+        
+        # The authenticated port speaks HTTPS, the readonly port plain HTTP
+        scheme = 'https' if port == self.DEFAULT_KUBELET_PORT else 'http'
+        url = f"{scheme}://{node_ip}:{port}/healthz"
+        
         try:
-            # Split version strings into parts
-            v1_parts = [int(x) for x in v1.split('.')]
-            v2_parts = [int(x) for x in v2.split('.')]
+            # Try to access kubelet healthz endpoint without authentication
+            # This will tell us if anonymous access is enabled; HEAD skips the body
+            timeout = (self.HEALTHZ_CONNECT_TIMEOUT, self.HEALTHZ_READ_TIMEOUT)
+            response = self._session.head(url, timeout=timeout, allow_redirects=False)
+            if response.status_code == 405:
+                response = self._session.get(url, timeout=timeout, allow_redirects=False)
             
-            # Pad with zeros if needed
-            max_len = max(len(v1_parts), len(v2_parts))
-            v1_parts.extend([0] * (max_len - len(v1_parts)))
-            v2_parts.extend([0] * (max_len - len(v2_parts)))
+            result['status_code'] = response.status_code
             
-            # Compare
-            for i in range(max_len):
-                if v1_parts[i] < v2_parts[i]:
-                    return -1
-                elif v1_parts[i] > v2_parts[i]:
-                    return 1
+            # A 200 without auth on the authenticated port means anonymous access is
+            # enabled; the readonly port has no auth, so a 200 there only means it's open
+            if response.status_code == 200 and port == self.DEFAULT_KUBELET_PORT:
+                result['anonymous_access'] = True
+                logger.warning(f"⚠️  Anonymous access enabled on {node_ip}:{port}")
             
-            return 0
+        except requests.exceptions.SSLError:
+            # Port is open but the TLS handshake failed
+            result['error'] = 'SSL verification failed (expected for kubelet)'
+            logger.debug("SSL error on %s:%s (may be expected)", node_ip, port)
+        except requests.exceptions.ConnectionError:
+            result['error'] = 'Port open but HTTP request failed'
+            logger.debug("HTTP request to %s failed", url)
+        except requests.exceptions.Timeout:
+            result['error'] = 'Request timeout'
+            logger.debug("Timeout requesting %s", url)
         except Exception as e:
-            logger.debug(f"Error comparing versions {v1} and {v2}: {e}")
-            return 0
+            result['error'] = str(e)
+            logger.debug("Error testing %s:%s: %s", node_ip, port, e)
+        
+        return result
     
-    def _test_kubelet_port(self, node_ip: str, port: int) -> Dict[str, Any]:
+    async def _test_kubelet_port_async(self, session: 'aiohttp.ClientSession', node_ip: str,
+                                       port: int) -> Dict[str, Any]:
         """
-        Test if a kubelet port is accessible and if anonymous access is enabled.
+        Test a kubelet port using asyncio, sharing one probe between callers for the same (ip, port) in a scan.
+        
+        Args:
+            session: Shared aiohttp session for kubelet probes
+            node_ip: Node IP address
+            port: Port number to test
+        
+        Returns:
+            Dictionary with test results
+        """
+        return await self._shared_probe_async((node_ip, port), self._probe_kubelet_port_async,
+                                              session, node_ip, port)
+    
+    async def _shared_probe_async(self, key: Tuple[Any, ...], probe, *args) -> Dict[str, Any]:
+        """
+        Run a probe coroutine once per key in a scan; concurrent and later callers share its result.
+        
+        Args:
+            key: Probe identity, e.g. (ip, port)
+            probe: Probe coroutine function to call
+            *args: Arguments for the probe coroutine
+        
+        Returns:
+            Dictionary with the probe's results
+        """
+        task = self._probes.get(key)
+        if task is None:
+            task = self._probes[key] = asyncio.ensure_future(probe(*args))
+        else:
+            logger.debug("Reusing probe result for %s", key)
+        
+        return await task
+    
+    async def _probe_kubelet_port_async(self, session: 'aiohttp.ClientSession', node_ip: str,
+                                        port: int) -> Dict[str, Any]:
+        """
+        Test if a kubelet port is accessible and if anonymous access is enabled using asyncio probes.
         
         Args:
+            session: Shared aiohttp session for kubelet probes
             node_ip: Node IP address
             port: Port number to test
         
@@ -460,40 +1064,68 @@ class KubeletScanner:
             'error': None
         }
         
-        url = f"https://{node_ip}:{port}"
+        # Cheap TCP reachability check before paying for an HTTP(S) round trip
+        try:
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection(node_ip, port),
+                timeout=self.CONNECT_TIMEOUT
+            )
+            writer.close()
+            result['accessible'] = True
+        except asyncio.TimeoutError:
+            result['error'] = 'Connection timeout'
+            logger.debug("Timeout connecting to %s:%s", node_ip, port)
+            return result
+        except OSError:
+            result['error'] = 'Connection refused or port closed'
+            logger.debug("Port %s not accessible on %s", port, node_ip)
+            return result
+        
+        # Let the transport finish closing, so closing sockets don't pile up under
+        # high concurrency; the port was reachable whatever happens here
+        try:
+            await asyncio.wait_for(writer.wait_closed(), timeout=self.CONNECT_TIMEOUT)
+        except (OSError, asyncio.TimeoutError):
+            pass
+        
+        # The authenticated port speaks HTTPS, the readonly port plain HTTP
+        scheme = 'https' if port == self.DEFAULT_KUBELET_PORT else 'http'
+        url = f"{scheme}://{node_ip}:{port}/healthz"
         
         try:
             # Try to access kubelet healthz endpoint without authentication
-            # This will tell us if the port is open and if anonymous access is enabled
-            response = requests.get(
-                f"{url}/healthz",
-                verify=False,  # Kubelet uses self-signed certs
-                timeout=5,
-                allow_redirects=False
+            # This will tell us if anonymous access is enabled; HEAD skips the body
+            timeout = aiohttp.ClientTimeout(
+                sock_connect=self.HEALTHZ_CONNECT_TIMEOUT,
+                sock_read=self.HEALTHZ_READ_TIMEOUT
             )
+            async with session.head(url, timeout=timeout, allow_redirects=False) as response:
+                status = response.status
+            if status == 405:
+                async with session.get(url, timeout=timeout, allow_redirects=False) as response:
+                    status = response.status
             
-            result['accessible'] = True
-            result['status_code'] = response.status_code
+            result['status_code'] = status
             
-            # If we get 200 OK without auth, anonymous access is enabled
-            if response.status_code == 200:
+            # A 200 without auth on the authenticated port means anonymous access is
+            # enabled; the readonly port has no auth, so a 200 there only means it's open
+            if status == 200 and port == self.DEFAULT_KUBELET_PORT:
                 result['anonymous_access'] = True
                 logger.warning(f"⚠️  Anonymous access enabled on {node_ip}:{port}")
             
-        except requests.exceptions.SSLError:
-            # SSL error might mean the port is open but requires proper cert
-            result['accessible'] = True
+        except aiohttp.ClientSSLError:
+            # Port is open but the TLS handshake failed
             result['error'] = 'SSL verification failed (expected for kubelet)'
-            logger.debug(f"SSL error on {node_ip}:{port} (may be expected)")
-        except requests.exceptions.ConnectionError:
-            result['error'] = 'Connection refused or port closed'
-            logger.debug(f"Port {port} not accessible on {node_ip}")
-        except requests.exceptions.Timeout:
-            result['error'] = 'Connection timeout'
-            logger.debug(f"Timeout connecting to {node_ip}:{port}")
+            logger.debug("SSL error on %s:%s (may be expected)", node_ip, port)
+        except aiohttp.ClientConnectionError:
+            result['error'] = 'Port open but HTTP request failed'
+            logger.debug("HTTP request to %s failed", url)
+        except asyncio.TimeoutError:
+            result['error'] = 'Request timeout'
+            logger.debug("Timeout requesting %s", url)
         except Exception as e:
             result['error'] = str(e)
-            logger.debug(f"Error testing {node_ip}:{port}: {e}")
+            logger.debug("Error testing %s:%s: %s", node_ip, port, e)
         
         return result
     
@@ -510,82 +1142,61 @@ class KubeletScanner:
         issues = []
         passed_checks = []
         
-        default_port = node_info.get('port_checks', {}).get('default_port', {})
-        readonly_port = node_info.get('port_checks', {}).get('readonly_port', {})
-        endpoint_checks = node_info.get('endpoint_checks', {})
+        port_checks = node_info.get('port_checks', {})
+        default_port = port_checks.get('default_port', {})
+        readonly_port = port_checks.get('readonly_port', {})
+        metrics_check = node_info.get('endpoint_checks', {}).get('metrics', {})
         version_vulns = node_info.get('version_vulnerabilities', {})
         
+        default_accessible = default_port.get('accessible')
+        default_anonymous = default_port.get('anonymous_access')
+        # Unprobed (NotReady) nodes can't be credited with closed ports
+        probes_skipped = port_checks.get('skipped', False)
+        
         # Check for anonymous access on default port
-        if default_port.get('anonymous_access'):
+        if default_anonymous:
             issues.append({
-                'severity': 'CRITICAL',
-                'type': 'anonymous_access_enabled',
-                'description': f"Anonymous authentication enabled on kubelet port {default_port.get('port')}. Port is accessible without authentication.",
-                'recommendation': 'Disable anonymous authentication by setting --anonymous-auth=false in kubelet configuration'
+                **_ISSUE_ANONYMOUS_AUTH,
+                'description': _ANONYMOUS_AUTH_DESC.format(port=default_port.get('port'))
             })
-        elif default_port.get('accessible'):
+        elif default_accessible:
             # Port is accessible but requires authentication - this is GOOD
             passed_checks.append({
                 'check': 'authentication_required',
-                'description': f"Kubelet port {default_port.get('port')} requires authentication (anonymous access disabled)",
+                'description': _AUTH_REQUIRED_DESC.format(port=default_port.get('port')),
                 'status': 'PASSED'
             })
         
         # Check if readonly port is accessible
         if readonly_port.get('accessible'):
             issues.append({
-                'severity': 'CRITICAL',
-                'type': 'readonly_port_enabled',
-                'description': f"Readonly port {readonly_port.get('port')} is accessible. This port should be disabled (set --read-only-port=0)",
-                'recommendation': 'Disable readonly port by setting --read-only-port=0 in kubelet configuration'
+                **_ISSUE_READONLY_PORT,
+                'description': _READONLY_PORT_DESC.format(port=readonly_port.get('port'))
             })
-        else:
+        elif not probes_skipped:
             # Readonly port is closed - this is GOOD
             passed_checks.append({
                 'check': 'readonly_port_disabled',
-                'description': f"Readonly port {readonly_port.get('port', 10255)} is disabled (closed)",
+                'description': _READONLY_CLOSED_DESC.format(port=readonly_port.get('port', 10255)),
                 'status': 'PASSED'
             })
         
         # Check if authorization mode might be AlwaysAllow (inferred from anonymous access)
-        if default_port.get('anonymous_access'):
-            issues.append({
-                'severity': 'CRITICAL',
-                'type': 'authorization_mode_alwaysallow',
-                'description': 'Authorization mode may be set to AlwaysAllow (inferred from anonymous access)',
-                'recommendation': 'Set --authorization-mode to Webhook or RBAC, not AlwaysAllow'
-            })
-        elif default_port.get('accessible') and not default_port.get('anonymous_access'):
+        if default_anonymous:
+            issues.append(dict(_ISSUE_AUTHZ_ALWAYSALLOW))
+        elif default_accessible:
             # If port is accessible but requires auth, authorization is likely not AlwaysAllow
-            passed_checks.append({
-                'check': 'authorization_mode_secure',
-                'description': 'Authorization mode appears to be secure (not AlwaysAllow, authentication required)',
-                'status': 'PASSED'
-            })
+            passed_checks.append(dict(_PASSED_AUTHZ_SECURE))
         
         # Check metrics endpoint
-        metrics_check = endpoint_checks.get('metrics', {})
         if metrics_check.get('anonymous_access'):
-            issues.append({
-                'severity': 'CRITICAL',
-                'type': 'metrics_endpoint_accessible',
-                'description': f"Metrics endpoint is accessible without authentication. This exposes sensitive metrics data.",
-                'recommendation': 'Restrict access to /metrics endpoint or ensure authentication is required'
-            })
-        elif metrics_check.get('accessible') and not metrics_check.get('anonymous_access'):
+            issues.append(dict(_ISSUE_METRICS_ACCESSIBLE))
+        elif metrics_check.get('accessible'):
             # Metrics endpoint requires auth - this is GOOD
-            passed_checks.append({
-                'check': 'metrics_endpoint_secured',
-                'description': 'Metrics endpoint requires authentication (not accessible anonymously)',
-                'status': 'PASSED'
-            })
-        elif not metrics_check.get('accessible'):
+            passed_checks.append(dict(_PASSED_METRICS_AUTH))
+        elif not probes_skipped:
             # Metrics endpoint not accessible - also good
-            passed_checks.append({
-                'check': 'metrics_endpoint_secured',
-                'description': 'Metrics endpoint is not accessible (properly secured)',
-                'status': 'PASSED'
-            })
+            passed_checks.append(dict(_PASSED_METRICS_CLOSED))
         
         # Check version vulnerabilities
         if version_vulns.get('is_vulnerable'):
@@ -618,8 +1229,14 @@ class KubeletScanner:
         """
         results = self.scan_kubelet_config()
         
-        with open(file_path, 'w') as f:
-            json.dump(results, f, indent=2)
+        if ORJSON_AVAILABLE:
+            # Encode before opening so a serialization error can't leave a truncated file
+            payload = orjson.dumps(results, option=orjson.OPT_INDENT_2)
+            with open(file_path, 'wb') as f:
+                f.write(payload)
+        else:
+            with open(file_path, 'w') as f:
+                json.dump(results, f, indent=2)
         
         logger.info(f"✅ Kubelet scan results saved to {file_path}")
 
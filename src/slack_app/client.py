@@ -5,17 +5,65 @@ Handles the core Slack API interactions and authentication.
 """
 
 import os
+import time
 import logging
-from typing import Optional, Dict, Any, List
+import threading
+from typing import Optional, Dict, Any, List, Tuple
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
+from slack_sdk.http_retry.builtin_handlers import RateLimitErrorRetryHandler
 
 logger = logging.getLogger(__name__)
 
 
+class _TokenBucket:
+    """Thread-safe token bucket used to pace outgoing Slack API calls."""
+    
+    def __init__(self, rate: float, capacity: int):
+        """
+        Initialize the token bucket.
+        
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of tokens (burst size)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        """Take one token, sleeping until one is available."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            
+            # Reserve the token now (going into debt if none is left), so waiting
+            # callers queue up in order without holding the lock while they sleep
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+        
+        if wait:
+            logger.debug("Rate limiting Slack API call for %.2fs", wait)
+            time.sleep(wait)
+
+
 class SlackClient:
     """Core Slack client for API interactions."""
     
+    # Slack allows roughly one message per second per channel
+    MESSAGE_RATE = 1.0
+    MESSAGE_BURST = 1
+    
+    # File uploads are a Tier 2 method (about 20 per minute)
+    FILE_RATE = 20 / 60
+    FILE_BURST = 1
+    
+    # Retries after an HTTP 429, waiting for the Retry-After Slack sends
+    RATE_LIMIT_RETRIES = 2
+    
     def __init__(self, token: Optional[str] = None):
         """
         Initialize the Slack client.
@@ -28,8 +76,30 @@ class SlackClient:
             raise ValueError("Slack OAuth token is required. Set SLACK_BOT_TOKEN environment variable or pass token directly.")
         
         self.client = WebClient(token=self.token)
+        self.client.retry_handlers.append(RateLimitErrorRetryHandler(max_retry_count=self.RATE_LIMIT_RETRIES))
         self.default_channel = os.getenv('DEFAULT_CHANNEL', '#general')
         self._channel_id_cache = {}  # Cache channel IDs to avoid repeated lookups
+        self._rate_limiters: Dict[Tuple[str, str], _TokenBucket] = {}
+        self._rate_limiters_lock = threading.Lock()
+    
+    def _wait_for_rate_limit(self, method: str, channel: str) -> None:
+        """
+        Pace a Slack API call using a token bucket per (method tier, channel).
+        
+        Args:
+            method: 'message' for chat.postMessage, 'file' for file uploads
+            channel: Channel the call targets
+        """
+        key = (method, channel)
+        with self._rate_limiters_lock:
+            bucket = self._rate_limiters.get(key)
+            if bucket is None:
+                if method == 'file':
+                    bucket = _TokenBucket(self.FILE_RATE, self.FILE_BURST)
+                else:
+                    bucket = _TokenBucket(self.MESSAGE_RATE, self.MESSAGE_BURST)
+                self._rate_limiters[key] = bucket
+        bucket.acquire()
     
     def send_message(self, text: str, channel: Optional[str] = None, **kwargs) -> Dict[str, Any]:
         """
@@ -46,6 +116,7 @@ class SlackClient:
         channel = channel or self.default_channel
         
         try:
+            self._wait_for_rate_limit('message', channel)
             response = self.client.chat_postMessage(
                 channel=channel,
                 text=text,
@@ -55,11 +126,11 @@ class SlackClient:
             if 'channel' in response.data:
                 self._channel_id_cache[channel] = response.data['channel']
             
-            logger.info(f"Message sent successfully to {channel}")
+            logger.info("Message sent successfully to %s", channel)
             return response.data
             
         except SlackApiError as e:
-            logger.error(f"Error sending message: {e.response['error']}")
+            logger.error("Error sending message: %s", e.response['error'])
             raise
     
     def send_rich_message(self, blocks: List[Dict], channel: Optional[str] = None, text: str = None, **kwargs) -> Dict[str, Any]:
@@ -78,6 +149,7 @@ class SlackClient:
         channel = channel or self.default_channel
         
         try:
+            self._wait_for_rate_limit('message', channel)
             response = self.client.chat_postMessage(
                 channel=channel,
                 blocks=blocks,
@@ -88,11 +160,11 @@ class SlackClient:
             if 'channel' in response.data:
                 self._channel_id_cache[channel] = response.data['channel']
             
-            logger.info(f"Rich message sent successfully to {channel}")
+            logger.info("Rich message sent successfully to %s", channel)
             return response.data
             
         except SlackApiError as e:
-            logger.error(f"Error sending rich message: {e.response['error']}")
+            logger.error("Error sending rich message: %s", e.response['error'])
             raise
     
     def _get_channel_id(self, channel: str) -> str:
@@ -127,11 +199,11 @@ class SlackClient:
                     return channel_id
             
             # If not found, return the original (might be a DM or already an ID)
-            logger.warning(f"Could not find channel ID for {channel}, using as-is")
+            logger.warning("Could not find channel ID for %s, using as-is", channel)
             return channel
             
         except SlackApiError as e:
-            logger.warning(f"Error resolving channel ID: {e.response['error']}, using channel name as-is")
+            logger.warning("Error resolving channel ID: %s, using channel name as-is", e.response['error'])
             return channel
     
     def send_file(self, file_path: str, channel: Optional[str] = None, 
@@ -154,17 +226,18 @@ class SlackClient:
             # Resolve channel name to ID for files_upload_v2
             channel_id = self._get_channel_id(channel)
             
+            self._wait_for_rate_limit('file', channel_id)
             response = self.client.files_upload_v2(
                 channel=channel_id,
                 file=file_path,
                 title=title,
                 initial_comment=comment
             )
-            logger.info(f"File sent successfully to {channel}")
+            logger.info("File sent successfully to %s", channel)
             return response.data
             
         except SlackApiError as e:
-            logger.error(f"Error sending file: {e.response['error']}")
+            logger.error("Error sending file: %s", e.response['error'])
             raise
     
     def upload_file(self, file_path: str, channel: Optional[str] = None,
@@ -4,9 +4,62 @@ Slack Formatter Module
 Handles formatting of kubelet scan results into Slack message blocks.
 """
 
-import json
-from typing import Dict, Any, List
-from datetime import datetime
+from collections import defaultdict
+from itertools import islice
+from typing import Dict, Any, List, Tuple
+
+
+# Overall report status -> (emoji, text, color); anything else is reported as healthy
+_STATUS_STYLE = {
+    'CRITICAL': ("🔴", "CRITICAL", "#ff0000"),
+    'WARNING': ("⚠️", "WARNING", "#ff9900")
+}
+_DEFAULT_STATUS_STYLE = ("✅", "HEALTHY", "#36a64f")
+
+# Per-node (emoji, risk level) by the most severe issue found on the node
+_RISK_HIGH = ("🔴", "HIGH")
+_RISK_MEDIUM = ("⚠️", "MEDIUM")
+_RISK_LOW = ("✅", "LOW")
+
+
+def _mrkdwn(text: str) -> Dict[str, Any]:
+    """Build a mrkdwn text object."""
+    return {"type": "mrkdwn", "text": text}
+
+
+def _text_section(text: str) -> Dict[str, Any]:
+    """Build a section block holding a single mrkdwn text."""
+    return {"type": "section", "text": _mrkdwn(text)}
+
+
+_DIVIDER = {"type": "divider"}
+
+
+def _section_heading(title: str) -> Tuple[Dict[str, Any], ...]:
+    """Build the divider and title blocks that open a report section."""
+    return (_DIVIDER, _text_section(title))
+
+
+# Fixed blocks are built once and shared between reports; they are never mutated
+_CRITICAL_HEADING = _section_heading("*🔴 Critical Issues:*")
+_WARNINGS_HEADING = _section_heading("*⚠️ Warnings:*")
+_PASSED_HEADING = _section_heading("*✅ Security Checks Passed:*")
+_NODE_DETAILS_HEADING = _section_heading("*📋 Node Details:*")
+_RECOMMENDATIONS_HEADING = _section_heading("*💡 Recommendations:*")
+_AI_HEADING = _section_heading("*🤖 AI-Powered Risk Analysis:*")
+_AI_INCOMPLETE_NOTE = "⚠️ _(analysis incomplete: the AI response was cut off)_"
+
+_TEST_BLOCKS = (
+    {
+        "type": "header",
+        "text": {
+            "type": "plain_text",
+            "text": "🧪 Test Message from Kubernetes Kubelet Checker",
+            "emoji": True
+        }
+    },
+    _text_section("This is a test message to verify Slack integration is working correctly.")
+)
 
 
 class SlackFormatter:
@@ -29,25 +82,25 @@ class SlackFormatter:
     @staticmethod
     def create_kubelet_blocks(summary: Dict[str, Any], analysis: Dict[str, Any] = None) -> List[Dict[str, Any]]:
         """Create Slack blocks for kubelet report."""
+        # Look up everything the report uses once
+        nodes = summary.get('nodes', [])
+        analysis = analysis or {}
+        critical_risks = analysis.get('critical_risks') or []
+        warnings = analysis.get('warnings')
+        passed_summary = (analysis.get('summary') or {}).get('passed_checks')
+        recommendations = analysis.get('recommendations')
+        ai_insights = analysis.get('ai_insights') or {}
+        ai_analysis = ai_insights.get('analysis')
+        
         # Determine overall status
-        status = summary.get('status', 'UNKNOWN')
-        if status == 'CRITICAL':
-            status_emoji = "🔴"
-            status_text = "CRITICAL"
-            status_color = "#ff0000"
-        elif status == 'WARNING':
-            status_emoji = "⚠️"
-            status_text = "WARNING"
-            status_color = "#ff9900"
-        else:
-            status_emoji = "✅"
-            status_text = "HEALTHY"
-            status_color = "#36a64f"
+        status_emoji, status_text, status_color = _STATUS_STYLE.get(
+            summary.get('status', 'UNKNOWN'), _DEFAULT_STATUS_STYLE
+        )
         
         total_nodes = summary.get('total_nodes', 0)
         nodes_with_issues = summary.get('nodes_with_issues', 0)
         healthy_nodes = total_nodes - nodes_with_issues
-        critical_count = len(analysis.get('critical_risks', [])) if analysis else 0
+        critical_count = len(critical_risks)
         
         blocks = [
             {
@@ -58,243 +111,132 @@ class SlackFormatter:
                     "emoji": True
                 }
             },
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": f"*Status:* {status_text}\n*Scan Time:* {summary.get('scan_time', 'Unknown')}"
-                }
-            },
+            _text_section(f"*Status:* {status_text}\n*Scan Time:* {summary.get('scan_time', 'Unknown')}"),
             {
                 "type": "section",
                 "fields": [
-                    {
-                        "type": "mrkdwn",
-                        "text": f"*Total Nodes:*\n`{total_nodes}`"
-                    },
-                    {
-                        "type": "mrkdwn",
-                        "text": f"*Nodes with Issues:*\n🔴 `{nodes_with_issues}`"
-                    },
-                    {
-                        "type": "mrkdwn",
-                        "text": f"*Healthy Nodes:*\n✅ `{healthy_nodes}`"
-                    },
-                    {
-                        "type": "mrkdwn",
-                        "text": f"*Critical Issues:*\n🔴 `{critical_count}`"
-                    }
+                    _mrkdwn(f"*Total Nodes:*\n`{total_nodes}`"),
+                    _mrkdwn(f"*Nodes with Issues:*\n🔴 `{nodes_with_issues}`"),
+                    _mrkdwn(f"*Healthy Nodes:*\n✅ `{healthy_nodes}`"),
+                    _mrkdwn(f"*Critical Issues:*\n🔴 `{critical_count}`")
                 ]
             }
         ]
         
-        # Add critical issues section
-        if analysis and analysis.get('critical_risks'):
-            blocks.append({"type": "divider"})
-            blocks.append({
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": "*🔴 Critical Issues:*"
-                }
-            })
-            for risk in analysis['critical_risks'][:5]:  # Show top 5
-                node_name = risk.get('node', 'Unknown')
-                issue_desc = risk.get('issue', 'Unknown issue')
-                blocks.append({
-                    "type": "section",
-                    "text": {
-                        "type": "mrkdwn",
-                        "text": f"• *{node_name}*: {issue_desc}"
-                    }
-                })
+        # Without analysis or nodes only the overview applies
+        if not analysis and not nodes:
+            return blocks
         
-        # Add warnings section
-        if analysis and analysis.get('warnings'):
-            blocks.append({"type": "divider"})
-            blocks.append({
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": "*⚠️ Warnings:*"
-                }
-            })
-            for warning in analysis['warnings'][:5]:  # Show top 5
-                node_name = warning.get('node', 'Unknown')
-                issue_desc = warning.get('issue', 'Unknown warning')
-                blocks.append({
-                    "type": "section",
-                    "text": {
-                        "type": "mrkdwn",
-                        "text": f"• *{node_name}*: {issue_desc}"
-                    }
-                })
+        # Add critical issues section (top 5)
+        if critical_risks:
+            blocks.extend(_CRITICAL_HEADING)
+            blocks.extend(
+                _text_section(f"• *{risk.get('node', 'Unknown')}*: {risk.get('issue', 'Unknown issue')}")
+                for risk in islice(critical_risks, 5)
+            )
+        
+        # Add warnings section (top 5)
+        if warnings:
+            blocks.extend(_WARNINGS_HEADING)
+            blocks.extend(
+                _text_section(f"• *{warning.get('node', 'Unknown')}*: {warning.get('issue', 'Unknown warning')}")
+                for warning in islice(warnings, 5)
+            )
         
         # Add passed checks section (security good practices)
-        if analysis and analysis.get('summary', {}).get('passed_checks'):
-            passed_checks = analysis['summary']['passed_checks']
-            if passed_checks:
-                blocks.append({"type": "divider"})
-                blocks.append({
-                    "type": "section",
-                    "text": {
-                        "type": "mrkdwn",
-                        "text": "*✅ Security Checks Passed:*"
-                    }
-                })
-                # Group by check type
-                check_types = {}
-                for check in passed_checks[:10]:  # Show top 10
-                    check_type = check.get('check', 'unknown')
-                    if check_type not in check_types:
-                        check_types[check_type] = []
-                    check_types[check_type].append(check.get('description', ''))
-                
-                for check_type, descriptions in list(check_types.items())[:5]:  # Show top 5 types
-                    unique_descriptions = list(set(descriptions))[:3]  # Show up to 3 unique descriptions
-                    for desc in unique_descriptions:
-                        blocks.append({
-                            "type": "section",
-                            "text": {
-                                "type": "mrkdwn",
-                                "text": f"✅ {desc}"
-                            }
-                        })
+        if passed_summary:
+            blocks.extend(_PASSED_HEADING)
+            # Group by check type
+            check_types = defaultdict(list)
+            for check in islice(passed_summary, 10):  # Show top 10
+                check_types[check.get('check', 'unknown')].append(check.get('description', ''))
+            
+            for descriptions in islice(check_types.values(), 5):  # Show top 5 types
+                # Show up to 3 unique descriptions, in the order they were reported
+                unique_descriptions = islice(dict.fromkeys(descriptions), 3)
+                blocks.extend(_text_section(f"✅ {desc}") for desc in unique_descriptions)
         
         # Add node details
-        nodes = summary.get('nodes', [])
         if nodes:
-            blocks.append({"type": "divider"})
-            blocks.append({
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": "*📋 Node Details:*"
-                }
-            })
+            blocks.extend(_NODE_DETAILS_HEADING)
             
-            for node in nodes[:10]:  # Show top 10
+            for node in islice(nodes, 10):  # Show top 10
                 node_name = node.get('name', 'Unknown')
                 node_ip = node.get('ip', 'N/A')
                 kubelet_version = node.get('kubelet_version', 'Unknown')
-                issues = node.get('issues', [])
+                issues = node.get('issues') or ()
                 issues_count = len(issues)
-                passed_checks = node.get('passed_checks', [])
-                passed_count = len(passed_checks)
+                passed_count = len(node.get('passed_checks') or ())
                 port_checks = node.get('port_checks', {})
                 version_vulns = node.get('version_vulnerabilities', {})
                 
-                # Determine risk level
-                has_critical = any(issue.get('severity') == 'CRITICAL' for issue in issues)
+                # Determine risk level, using the scanner's severity count when present
+                node_critical_count = node.get('critical_count')
+                if node_critical_count is None:
+                    has_critical = 'CRITICAL' in [issue.get('severity') for issue in issues]
+                else:
+                    has_critical = node_critical_count > 0
                 if has_critical:
-                    emoji = "🔴"
-                    risk_level = "HIGH"
+                    emoji, risk_level = _RISK_HIGH
                 elif issues_count > 0:
-                    emoji = "⚠️"
-                    risk_level = "MEDIUM"
-                else:
-                    emoji = "✅"
-                    risk_level = "LOW"
-                
-                # Build port status text
-                port_status_parts = []
-                default_port = port_checks.get('default_port', {})
-                readonly_port = port_checks.get('readonly_port', {})
-                
-                if default_port.get('accessible'):
-                    if default_port.get('anonymous_access'):
-                        port_status_parts.append(f"Port {default_port.get('port', 10250)}: OPEN (ANONYMOUS)")
-                    else:
-                        port_status_parts.append(f"Port {default_port.get('port', 10250)}: OPEN (AUTH REQUIRED)")
+                    emoji, risk_level = _RISK_MEDIUM
                 else:
-                    port_status_parts.append(f"Port {default_port.get('port', 10250)}: CLOSED")
+                    emoji, risk_level = _RISK_LOW
                 
-                if readonly_port.get('accessible'):
-                    port_status_parts.append(f"Readonly {readonly_port.get('port', 10255)}: OPEN")
+                # Build port status text (a skipped node was never probed, so it isn't CLOSED)
+                if port_checks.get('skipped'):
+                    port_status = f"Ports: SKIPPED ({port_checks.get('reason', 'unknown')})"
                 else:
-                    port_status_parts.append(f"Readonly {readonly_port.get('port', 10255)}: CLOSED")
-                
-                port_status = " | ".join(port_status_parts) if port_status_parts else "Port checks unavailable"
+                    default_port = port_checks.get('default_port', {})
+                    readonly_port = port_checks.get('readonly_port', {})
+                    
+                    if not default_port.get('accessible'):
+                        default_state = "CLOSED"
+                    elif default_port.get('anonymous_access'):
+                        default_state = "OPEN (ANONYMOUS)"
+                    else:
+                        default_state = "OPEN (AUTH REQUIRED)"
+                    readonly_state = "OPEN" if readonly_port.get('accessible') else "CLOSED"
+                    
+                    port_status = (
+                        f"Port {default_port.get('port', 10250)}: {default_state} | "
+                        f"Readonly {readonly_port.get('port', 10255)}: {readonly_state}"
+                    )
                 
                 # Build version status
-                version_status = f"Version: {kubelet_version}"
                 if version_vulns.get('is_vulnerable'):
-                    version_status += " 🔴 (VULNERABLE)"
+                    version_flag = " 🔴 (VULNERABLE)"
                 elif kubelet_version != 'Unknown':
-                    version_status += " ✅"
+                    version_flag = " ✅"
+                else:
+                    version_flag = ""
                 
-                status_text = f"{emoji} *{node_name}* (IP: {node_ip})\n*Risk:* {risk_level} | *Issues:* {issues_count}"
-                if passed_count > 0:
-                    status_text += f" | *Passed Checks:* {passed_count}"
-                status_text += f" | {port_status}\n{version_status}"
+                passed_text = f" | *Passed Checks:* {passed_count}" if passed_count > 0 else ""
+                status_text = (
+                    f"{emoji} *{node_name}* (IP: {node_ip})\n*Risk:* {risk_level} | *Issues:* {issues_count}"
+                    f"{passed_text} | {port_status}\nVersion: {kubelet_version}{version_flag}"
+                )
                 
-                blocks.append({
-                    "type": "section",
-                    "text": {
-                        "type": "mrkdwn",
-                        "text": status_text
-                    }
-                })
+                blocks.append(_text_section(status_text))
         
-        # Add recommendations
-        if analysis and analysis.get('recommendations'):
-            blocks.append({"type": "divider"})
-            blocks.append({
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": "*💡 Recommendations:*"
-                }
-            })
-            for rec in analysis['recommendations'][:5]:  # Show top 5
-                blocks.append({
-                    "type": "section",
-                    "text": {
-                        "type": "mrkdwn",
-                        "text": f"• {rec}"
-                    }
-                })
+        # Add recommendations (top 5)
+        if recommendations:
+            blocks.extend(_RECOMMENDATIONS_HEADING)
+            blocks.extend(_text_section(f"• {rec}") for rec in islice(recommendations, 5))
         
         # Add AI analysis if available
-        if analysis and analysis.get('ai_insights') and analysis['ai_insights'].get('analysis'):
-            blocks.append({"type": "divider"})
-            blocks.append({
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": "*🤖 AI-Powered Risk Analysis:*"
-                }
-            })
+        if ai_analysis:
             # Truncate AI analysis for Slack (it's long)
-            ai_text = analysis['ai_insights']['analysis'][:1000] + "..." if len(analysis['ai_insights']['analysis']) > 1000 else analysis['ai_insights']['analysis']
-            blocks.append({
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": f"```{ai_text}```"
-                }
-            })
+            ai_text = ai_analysis[:1000] + ("..." if len(ai_analysis) > 1000 else "")
+            blocks.extend(_AI_HEADING)
+            blocks.append(_text_section(f"```{ai_text}```"))
+            if ai_insights.get('truncated'):
+                blocks.append(_text_section(_AI_INCOMPLETE_NOTE))
         
         return blocks
     
     @staticmethod
     def create_test_blocks() -> List[Dict[str, Any]]:
         """Create test blocks for testing Slack integration."""
-        return [
-            {
-                "type": "header",
-                "text": {
-                    "type": "plain_text",
-                    "text": "🧪 Test Message from Kubernetes Kubelet Checker",
-                    "emoji": True
-                }
-            },
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": "This is a test message to verify Slack integration is working correctly."
-                }
-            }
-        ]
+        return list(_TEST_BLOCKS)
 
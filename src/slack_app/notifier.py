@@ -8,19 +8,52 @@ import os
 import json
 import time
 import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from datetime import datetime, timezone
 from typing import Optional, Dict, Any
 from pathlib import Path
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from inotify_simple import INotify, flags
+    INOTIFY_AVAILABLE = True
+except ImportError:
+    INOTIFY_AVAILABLE = False
+
 from .client import SlackClient
 from .formatter import SlackFormatter
-from utils.html_report import HTMLReportGenerator
 
 logger = logging.getLogger(__name__)
 
+# Notification text for the report, filled from the parsed scan summary
+_FALLBACK_TEXT = "🔐 Kubernetes Kubelet Security Check - {total_nodes} nodes, {nodes_with_issues} with issues"
+
 
 class SlackNotifier:
     """Handles sending kubelet scan results to Slack."""
     
+    # Seconds between checks for the results file when inotify isn't available
+    CHECK_INTERVAL = 5
+    
+    # Longest a single inotify read blocks before checking for a stop request
+    STOP_CHECK_INTERVAL = 1
+    
+    # Directory the HTML report is written to before upload
+    REPORT_DIR = "/tmp"
+    
+    # SlackFormatter holds no state, so every notifier shares one
+    _FORMATTER = SlackFormatter()
+    
+    # Attempts (and seconds between them) at parsing a results file that may still be being written
+    LOAD_ATTEMPTS = 3
+    LOAD_RETRY_DELAY = 0.5
+    
     def __init__(self, client: SlackClient):
         """
         Initialize the Slack notifier.
@@ -29,7 +62,14 @@ class SlackNotifier:
             client: SlackClient instance for API interactions
         """
         self.client = client
-        self.formatter = SlackFormatter()
+        self.formatter = self._FORMATTER
+        self.stop_event = threading.Event()
+        # True while monitor_for_scan_output is waiting for the results file
+        self.waiting_for_results = False
+    
+    def stop(self) -> None:
+        """Stop waiting for scan results, e.g. from a SIGTERM handler."""
+        self.stop_event.set()
     
     def send_kubelet_report(self, scan_data: Dict[str, Any], analysis: Dict[str, Any] = None,
                            channel: Optional[str] = None) -> Dict[str, Any]:
@@ -44,6 +84,8 @@ class SlackNotifier:
         Returns:
             Response from Slack API
         """
+        channel = channel or self.client.default_channel
+        
         # Extract summary information
         summary = self.formatter.parse_kubelet_summary(scan_data)
         
@@ -51,45 +93,80 @@ class SlackNotifier:
         blocks = self.formatter.create_kubelet_blocks(summary, analysis)
         
         # Create fallback text
-        fallback_text = f"🔐 Kubernetes Kubelet Security Check - {summary['total_nodes']} nodes, {summary['nodes_with_issues']} with issues"
+        fallback_text = _FALLBACK_TEXT.format_map(summary)
         
-        try:
-            response = self.client.send_rich_message(
-                channel=channel,
-                text=fallback_text,
-                blocks=blocks
-            )
-            logger.info(f"Kubelet report sent successfully to {channel or self.client.default_channel}")
-            
-            # Generate and send HTML report
-            logger.info("📊 Generating HTML report...")
-            try:
-                timestamp = time.strftime('%Y%m%d-%H%M%S', time.gmtime())
-                html_path = Path(f"/tmp/kubelet-report-{timestamp}.html")
+        timestamp = datetime.now(timezone.utc).strftime('%Y%m%d-%H%M%S')
+        html_path = f"{self.REPORT_DIR}/kubelet-report-{timestamp}.html"
+        
+        # Generate the HTML report in the background while the message is posted
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            html_report = None
+            if os.access(self.REPORT_DIR, os.W_OK):
+                from utils.html_report import HTMLReportGenerator
                 
-                HTMLReportGenerator.generate_kubelet_report(
+                logger.info("📊 Generating HTML report...")
+                html_report = executor.submit(
+                    HTMLReportGenerator.write_kubelet_report,
                     scan_data,
                     analysis,
-                    str(html_path)
+                    html_path
                 )
-                
-                # Send HTML report to Slack
-                self.client.send_file(
-                    str(html_path),
+            else:
+                logger.warning("⚠️  %s is not writable, skipping HTML report", self.REPORT_DIR)
+            
+            try:
+                response = self.client.send_rich_message(
                     channel=channel,
-                    title=f"Kubelet Security Check Report - {timestamp}",
-                    comment="📊 Detailed HTML report - Download and open in your browser!"
+                    text=fallback_text,
+                    blocks=blocks
                 )
-                logger.info(f"✅ HTML report sent to Slack: {html_path}")
+                logger.info("Kubelet report sent successfully to %s", channel)
                 
             except Exception as e:
-                logger.warning(f"⚠️  Failed to generate/send HTML report: {e}")
+                logger.error("Error sending kubelet report: %s", e)
+                # There's no message to attach the report to, so don't leave it behind
+                if html_report is not None:
+                    self._discard_html_report(html_report, html_path)
+                raise
             
-            return response
+            # Send HTML report to Slack once it has been written
+            if html_report is not None:
+                try:
+                    html_report.result()
+                except Exception as e:
+                    logger.warning("⚠️  Failed to generate HTML report: %s", e)
+                    self._discard_html_report(html_report, html_path)
+                    return response
+                
+                try:
+                    self.client.send_file(
+                        html_path,
+                        channel=channel,
+                        title=f"Kubelet Security Check Report - {timestamp}",
+                        comment="📊 Detailed HTML report - Download and open in your browser!"
+                    )
+                    logger.info("✅ HTML report sent to Slack: %s", html_path)
+                    
+                except Exception as e:
+                    logger.warning("⚠️  Failed to send HTML report: %s", e)
             
-        except Exception as e:
-            logger.error(f"Error sending kubelet report: {e}")
-            raise
+            return response
+    
+    @staticmethod
+    def _discard_html_report(html_report: Future, html_path: str) -> None:
+        """
+        Wait for a background HTML report to finish and remove whatever it wrote.
+        
+        Args:
+            html_report: Future of the HTML report being written
+            html_path: Path the report is written to
+        """
+        # Don't remove the file while the writer still has it open
+        wait([html_report])
+        try:
+            os.remove(html_path)
+        except FileNotFoundError:
+            pass
     
     def send_test_message(self, channel: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -101,26 +178,26 @@ class SlackNotifier:
         Returns:
             Response from Slack API
         """
+        channel = channel or self.client.default_channel
+        
         try:
-            # Send simple test message
-            response = self.client.send_message(
-                "🧪 Test message from Kubernetes kubelet checker! 🔐",
-                channel=channel
+            # Send the rich test message, with the simple text as its notification fallback
+            response = self.client.send_rich_message(
+                self.formatter.create_test_blocks(),
+                channel=channel,
+                text="🧪 Test message from Kubernetes kubelet checker! 🔐"
             )
             
-            # Send rich test message
-            blocks = self.formatter.create_test_blocks()
-            self.client.send_rich_message(blocks, channel=channel)
-            
-            logger.info(f"Test messages sent successfully to {channel or self.client.default_channel}")
+            logger.info("Test message sent successfully to %s", channel)
             return response
             
         except Exception as e:
-            logger.error(f"Error sending test message: {e}")
+            logger.error("Error sending test message: %s", e)
             raise
     
     def monitor_for_scan_output(self, output_dir: str, max_wait_time: int = 300,
-                                channel: Optional[str] = None) -> Optional[Dict[str, Any]]:
+                                channel: Optional[str] = None, poll: bool = False,
+                                stop_event: Optional[threading.Event] = None) -> Optional[Dict[str, Any]]:
         """
         Monitor for kubelet scan output file and send report when available.
         
@@ -128,53 +205,140 @@ class SlackNotifier:
             output_dir: Directory to monitor for scan results
             max_wait_time: Maximum time to wait for scan results (seconds)
             channel: Channel to send to (defaults to DEFAULT_CHANNEL)
+            poll: Poll for the file instead of waiting on inotify events (for network filesystems)
+            stop_event: Event that ends the wait early when set (defaults to the notifier's stop_event)
         
         Returns:
             Response from Slack API if scan results found, None otherwise
         """
+        stop_event = stop_event or self.stop_event
         output_path = Path(output_dir)
         results_file = output_path / "kubelet-scan-results.json"
         
-        logger.info(f"Monitoring for scan results at {results_file} (max wait: {max_wait_time}s)...")
+        logger.info("Monitoring for scan results at %s (max wait: %ss)...", results_file, max_wait_time)
         
-        start_time = time.time()
-        check_interval = 5  # Check every 5 seconds
+        self.waiting_for_results = True
+        try:
+            found = self._wait_for_file(results_file, max_wait_time, stop_event, poll)
+        finally:
+            self.waiting_for_results = False
         
-        while time.time() - start_time < max_wait_time:
-            if results_file.exists():
-                logger.info(f"✅ Scan results found at {results_file}")
-                
-                try:
-                    # Load scan results
-                    with open(results_file, 'r') as f:
-                        scan_data = json.load(f)
-                    
-                    # Analyze results
-                    from kubelet_scanner import KubeletAnalyzer
-                    from utils import Config
-                    
-                    # Initialize analyzer with OpenAI if enabled
-                    config = Config()
-                    if config.is_openai_enabled():
-                        analyzer = KubeletAnalyzer(
-                            openai_api_key=config.get_openai_api_key(),
-                            openai_model=config.get_openai_model()
-                        )
-                        logger.info("🤖 AI-powered kubelet analysis enabled")
-                    else:
-                        analyzer = KubeletAnalyzer()
-                    
-                    analysis = analyzer.analyze_results(scan_data)
-                    
-                    # Send report (includes HTML report)
-                    return self.send_kubelet_report(scan_data, analysis, channel)
-                    
-                except Exception as e:
-                    logger.error(f"Error processing scan results: {e}")
-                    return None
+        if not found:
+            if stop_event.is_set():
+                logger.info("🛑 Stopped waiting for scan results")
+                return None
+            logger.warning("⏱️  Timeout waiting for scan results after %ss", max_wait_time)
+            return None
+        
+        logger.info("✅ Scan results found at %s", results_file)
+        
+        try:
+            # Load scan results
+            scan_data = self._load_scan_results(results_file)
+            
+            # Analyze results
+            from kubelet_scanner import KubeletAnalyzer
+            from utils import Config
+            
+            # Initialize analyzer with OpenAI if enabled
+            config = Config()
+            if config.is_openai_enabled():
+                analyzer = KubeletAnalyzer(
+                    openai_api_key=config.get_openai_api_key(),
+                    openai_model=config.get_openai_model()
+                )
+                logger.info("🤖 AI-powered kubelet analysis enabled")
+            else:
+                analyzer = KubeletAnalyzer()
+            
+            analysis = analyzer.analyze_results(scan_data)
+            
+            # Send report (includes HTML report)
+            return self.send_kubelet_report(scan_data, analysis, channel)
+            
+        except Exception as e:
+            logger.error("Error processing scan results: %s", e)
+            return None
+    
+    def _load_scan_results(self, results_file: Path) -> Dict[str, Any]:
+        """
+        Parse the scan results file, retrying briefly if it is empty or truncated.
+        
+        Args:
+            results_file: Path to the scan results JSON
+        
+        Returns:
+            Parsed scan results
+        """
+        for attempt in range(1, self.LOAD_ATTEMPTS + 1):
+            with open(results_file, 'rb') as f:
+                raw = f.read()
             
-            time.sleep(check_interval)
+            try:
+                return orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+            except ValueError:
+                # Found before the scanner finished writing it (e.g. when polling)
+                if attempt == self.LOAD_ATTEMPTS:
+                    raise
+                logger.debug("Scan results at %s not complete yet, retrying", results_file)
+                time.sleep(self.LOAD_RETRY_DELAY)
+    
+    def _wait_for_file(self, file_path: Path, max_wait_time: float, stop_event: threading.Event,
+                       poll: bool = False) -> bool:
+        """
+        Wait for a file to be written, using inotify events when available.
+        
+        Args:
+            file_path: File to wait for
+            max_wait_time: Maximum time to wait (seconds)
+            stop_event: Event that ends the wait early when set
+            poll: Always poll, e.g. on network filesystems where inotify sees no remote writes
+        
+        Returns:
+            True if the file exists, False on timeout or stop
+        """
+        if INOTIFY_AVAILABLE and not poll and file_path.parent.is_dir():
+            try:
+                return self._wait_for_file_inotify(file_path, max_wait_time, stop_event)
+            except OSError as e:
+                logger.warning("⚠️  inotify unavailable (%s), polling for scan results instead", e)
+        
+        path = str(file_path)
+        start_time = time.time()
+        while time.time() - start_time < max_wait_time:
+            if os.path.isfile(path):
+                return True
+            if stop_event.wait(self.CHECK_INTERVAL):
+                return False
+        
+        return False
+    
+    def _wait_for_file_inotify(self, file_path: Path, max_wait_time: float, stop_event: threading.Event) -> bool:
+        """
+        Block on inotify events until the file is closed after writing or moved into place.
         
-        logger.warning(f"⏱️  Timeout waiting for scan results after {max_wait_time}s")
-        return None
+        Args:
+            file_path: File to wait for
+            max_wait_time: Maximum time to wait (seconds)
+            stop_event: Event that ends the wait early when set
+        
+        Returns:
+            True if the file exists, False on timeout or stop
+        """
+        with INotify() as inotify:
+            inotify.add_watch(str(file_path.parent), flags.CLOSE_WRITE | flags.MOVED_TO)
+            
+            # Check only once the watch is in place, so a file written in between isn't missed
+            if file_path.exists():
+                return True
+            
+            deadline = time.monotonic() + max_wait_time
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or stop_event.is_set():
+                    return False
+                timeout = min(remaining, self.STOP_CHECK_INTERVAL)
+                for event in inotify.read(timeout=int(timeout * 1000)):
+                    if event.name == file_path.name:
+                        return True
 
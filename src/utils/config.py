@@ -4,10 +4,26 @@ Configuration Module
 Handles application configuration from YAML files and environment variables.
 """
 
+import copy
 import os
 import yaml
-from typing import Optional, Dict, Any
-from pathlib import Path
+from typing import Optional, Dict, Tuple
+
+# Use the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YAMLLoader
+except ImportError:
+    from yaml import SafeLoader as _YAMLLoader
+
+try:
+    import tomllib
+    TOMLLIB_AVAILABLE = True
+except ImportError:
+    TOMLLIB_AVAILABLE = False
+
+# Parsed YAML config per (path, mtime), so building another Config in the same
+# process doesn't re-read and re-parse an unchanged file
+_YAML_CACHE: Dict[Tuple[str, int], dict] = {}
 
 
 class Config:
@@ -18,7 +34,7 @@ class Config:
         Initialize configuration from YAML file with fallback to environment variables.
         
         Args:
-            config_file: Path to config YAML file (default: config.yaml)
+            config_file: Path to config YAML file, or TOML file on Python 3.11+ (default: config.yaml)
         """
         self.config_file = config_file
         self.config_data = {}
@@ -30,24 +46,45 @@ class Config:
             os.path.join("..", config_file),  # Parent directory (relative)
         ]
         
-        config_found = None
+        # Candidates often resolve to the same file (e.g. in the container, where the
+        # working directory is the project root), so check each location only once
+        candidates = {}
         for path in config_paths:
+            candidates.setdefault(os.path.abspath(path), path)
+        
+        config_found = None
+        for path in candidates.values():
             if os.path.exists(path):
                 config_found = path
                 break
         
+        # Without tomllib a TOML file would be handed to the YAML parser, so refuse it clearly
+        if config_found and config_found.endswith('.toml') and not TOMLLIB_AVAILABLE:
+            raise ValueError(f"TOML config file {config_found} requires Python 3.11+ (tomllib); use a YAML config instead")
+        
         # Try to load from YAML file
         if config_found:
             try:
-                with open(config_found, 'r') as f:
-                    self.config_data = yaml.safe_load(f) or {}
-                print(f"✅ Loaded configuration from {config_found}")
+                cache_key = (os.path.abspath(config_found), os.stat(config_found).st_mtime_ns)
+                if cache_key not in _YAML_CACHE:
+                    if config_found.endswith('.toml'):
+                        with open(config_found, 'rb') as f:
+                            _YAML_CACHE[cache_key] = tomllib.load(f)
+                    else:
+                        with open(config_found, 'r') as f:
+                            _YAML_CACHE[cache_key] = yaml.load(f, Loader=_YAMLLoader) or {}
+                    print(f"✅ Loaded configuration from {config_found}")
+                # Each Config gets its own copy, so mutating one can't leak into the cache
+                self.config_data = copy.deepcopy(_YAML_CACHE[cache_key])
                 self.config_file = config_found
             except Exception as e:
                 print(f"⚠️ Could not load config file: {e}, using environment variables")
         else:
             print(f"⚠️ config.yaml not found in {', '.join(config_paths)}, using environment variables")
         
+        # Snapshot the environment once so each fallback is a plain dict lookup
+        self._env = dict(os.environ)
+        
         # Load values (YAML first, then env vars as fallback)
         self.slack_bot_token = self._get_value(['slack', 'bot_token'], 'SLACK_BOT_TOKEN')
         self.slack_channel = self._get_value(['slack', 'channel'], 'SLACK_CHANNEL', '#kubelet-check')
@@ -55,6 +92,12 @@ class Config:
         self.output_dir = self._get_value(['kubernetes', 'output_dir'], 'KUBELET_CHECK_OUTPUT_DIR', '/tmp/kubelet-check-results')
         self.max_wait_time = int(self._get_value(['kubernetes', 'max_wait_time'], 'MAX_WAIT_TIME', '300'))
         self.namespace = self._get_value(['kubernetes', 'namespace'], 'NAMESPACE', 'kubelet-check')
+        self.node_cache_ttl = int(self._get_value(['kubernetes', 'node_cache_ttl'], 'NODE_CACHE_TTL', '60'))
+        self.watch_nodes = self._get_value(['kubernetes', 'watch_nodes'], 'WATCH_NODES', 'false').lower() == 'true'
+        # A dedicated variable, since pods commonly inject NODE_NAME via the Downward API
+        self.node_name = self._get_value(['kubernetes', 'scan_node_name'], 'SCAN_NODE_NAME', None)
+        self.scanner_concurrency = int(self._get_value(['kubernetes', 'scanner_concurrency'], 'SCANNER_CONCURRENCY', '64'))
+        self.file_watch_polling = self._get_value(['kubernetes', 'file_watch_polling'], 'FILE_WATCH_POLLING', 'false').lower() == 'true'
         
         # Docker config
         self.docker_username = self._get_value(['docker', 'username'], 'DOCKER_USERNAME', None)
@@ -86,7 +129,7 @@ class Config:
             return str(value)
         
         # Try environment variable
-        env_value = os.getenv(env_var)
+        env_value = self._env.get(env_var)
         if env_value:
             return env_value
         
@@ -120,6 +163,26 @@ class Config:
         """Get maximum wait time for scan output."""
         return self.max_wait_time
     
+    def get_node_cache_ttl(self) -> int:
+        """Get node list cache TTL in seconds."""
+        return self.node_cache_ttl
+    
+    def is_watch_nodes_enabled(self) -> bool:
+        """Check if the watch-backed node cache is enabled."""
+        return self.watch_nodes
+    
+    def get_node_name(self) -> Optional[str]:
+        """Get the single node to scan, if scanning is limited to one node."""
+        return self.node_name
+    
+    def get_scanner_concurrency(self) -> int:
+        """Get the maximum number of nodes scanned concurrently."""
+        return self.scanner_concurrency
+    
+    def is_file_watch_polling(self) -> bool:
+        """Check if the output directory should be polled instead of watched with inotify."""
+        return self.file_watch_polling
+    
     def is_debug(self) -> bool:
         """Check if debug mode is enabled."""
         return self.debug
@@ -4,99 +4,95 @@ HTML Report Generator Module
 Converts kubelet scan results into a beautiful HTML report.
 """
 
-import json
 import time
 import re
-from typing import Dict, Any, Optional
-from pathlib import Path
-from datetime import datetime
+import gzip
+from itertools import groupby
+from operator import itemgetter
+from typing import Dict, Any, Iterator, Tuple
+
+# AI analysis markdown patterns, compiled once
+_AI_SECTION_HEADING_RE = re.compile(r'\*\*\d+\.\s+[^*]+\*\*')  # section headings: **1. Title**
+_AI_HEADING_RE = re.compile(r'\*\*\d+\.')
+_BOLD_RE = re.compile(r'\*\*([^*]+)\*\*')
+_LIST_ITEM_RE = re.compile(r'(?:<strong>)?(\d+)\.\s+(.+?)(?:</strong>)?$')
+
+# HTML special characters, replaced in a single str.translate pass
+_HTML_ESCAPE_TABLE = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&#x27;'
+})
+
+# Fields the scanner always writes for a node, read in one call when rendering it
+_NODE_FIELDS = itemgetter('name', 'ip', 'issues', 'port_checks', 'passed_checks')
+
+
+def _compact_css(css: str) -> str:
+    """Drop the indentation and line breaks from a stylesheet whose lines each end a declaration or block."""
+    return "".join(line.strip() for line in css.splitlines())
+
+
+def _escape(value: Any) -> str:
+    """Escape a scan or analysis value for interpolation into the report HTML."""
+    return str(value).translate(_HTML_ESCAPE_TABLE)
+
+
+def _passed_check_group(check: Dict[str, Any]) -> Tuple[str, str]:
+    """Key passed checks by (check type, description) for grouping."""
+    return check.get('check', 'unknown'), check.get('description', '')
 
 
 class HTMLReportGenerator:
     """Generates HTML reports from kubelet scan data."""
     
-    @staticmethod
-    def generate_kubelet_report(scan_data: Dict[str, Any], analysis: Dict[str, Any] = None,
-                               output_path: str = None) -> str:
-        """
-        Generate a styled HTML report from kubelet scan data.
-        
-        Args:
-            scan_data: Kubelet scan results
-            analysis: Kubelet analysis results (optional)
-            output_path: Optional path to save the HTML file
-            
-        Returns:
-            HTML content as string
-        """
-        summary = scan_data.get('summary', {})
-        nodes = scan_data.get('nodes', [])
-        
-        total_nodes = summary.get('total_nodes', 0)
-        nodes_with_issues = summary.get('nodes_with_issues', 0)
-        status = scan_data.get('status', 'UNKNOWN')
-        
-        # Determine overall status
-        if status == 'CRITICAL':
-            status_color = "#ef4444"
-        elif status == 'WARNING':
-            status_color = "#f59e0b"
-        else:
-            status_color = "#10b981"
-        
-        # Calculate values before f-string
-        healthy_nodes = total_nodes - nodes_with_issues
-        
-        # Generate HTML
-        html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Kubernetes Kubelet Security Check Report - {time.strftime('%Y-%m-%d %H:%M:%S UTC', time.gmtime())}</title>
-    <style>
-        * {{
+    # Static page styling and script, shared by every report (the status banner
+    # colour depends on the scan, so it is added per report). The styling is kept
+    # readable here and compacted once, so it doesn't bloat every report file.
+    _CSS = _compact_css("""
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
         
-        body {{
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif;
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             padding: 20px;
             line-height: 1.6;
-        }}
+        }
         
-        .container {{
+        .container {
             max-width: 1200px;
             margin: 0 auto;
             background: white;
             border-radius: 12px;
             box-shadow: 0 20px 60px rgba(0,0,0,0.3);
             overflow: hidden;
-        }}
+        }
         
-        .header {{
+        .header {
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             color: white;
             padding: 40px;
             text-align: center;
-        }}
+        }
         
-        .header h1 {{
+        .header h1 {
             font-size: 2.5em;
             margin-bottom: 10px;
             font-weight: 700;
-        }}
+        }
         
-        .header .timestamp {{
+        .header .timestamp {
             opacity: 0.9;
             font-size: 0.9em;
-        }}
+        }
         
-        .status-banner {{
-            background: {status_color};
+        .status-banner {
             color: white;
             padding: 30px;
             text-align: center;
@@ -104,69 +100,69 @@ class HTMLReportGenerator:
             font-weight: bold;
             text-transform: uppercase;
             letter-spacing: 2px;
-        }}
+        }
         
-        .summary {{
+        .summary {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
             gap: 20px;
             padding: 40px;
             background: #f9fafb;
-        }}
+        }
         
-        .summary-card {{
+        .summary-card {
             background: white;
             padding: 25px;
             border-radius: 8px;
             box-shadow: 0 2px 8px rgba(0,0,0,0.1);
             text-align: center;
             transition: transform 0.2s;
-        }}
+        }
         
-        .summary-card:hover {{
+        .summary-card:hover {
             transform: translateY(-5px);
             box-shadow: 0 4px 12px rgba(0,0,0,0.15);
-        }}
+        }
         
-        .summary-card .number {{
+        .summary-card .number {
             font-size: 3em;
             font-weight: bold;
             margin: 10px 0;
-        }}
+        }
         
-        .summary-card .label {{
+        .summary-card .label {
             color: #6b7280;
             font-size: 0.9em;
             text-transform: uppercase;
             letter-spacing: 1px;
-        }}
+        }
         
-        .total {{ color: #3b82f6; }}
-        .issues {{ color: #ef4444; }}
-        .healthy {{ color: #10b981; }}
+        .total { color: #3b82f6; }
+        .issues { color: #ef4444; }
+        .healthy { color: #10b981; }
         
-        .content {{
+        .content {
             padding: 40px;
-        }}
+        }
         
-        .section {{
+        .section {
             margin-bottom: 40px;
-        }}
+        }
         
-        .section h2 {{
+        .section h2 {
             font-size: 1.8em;
             margin-bottom: 20px;
             color: #1f2937;
-        }}
+        }
         
-        .node {{
+        .node {
             border: 1px solid #e5e7eb;
             border-radius: 8px;
             margin-bottom: 20px;
             overflow: hidden;
-        }}
+        }
         
-        .node-header {{
+        .node-header {
             padding: 20px;
             cursor: pointer;
             display: flex;
@@ -174,213 +170,232 @@ class HTMLReportGenerator:
             align-items: center;
             background: #f9fafb;
             transition: background 0.2s;
-        }}
+        }
         
-        .node-header:hover {{
+        .node-header:hover {
             background: #f3f4f6;
-        }}
+        }
         
-        .node-title {{
+        .node-title {
             font-size: 1.2em;
             font-weight: 600;
             color: #1f2937;
-        }}
+        }
         
-        .node-status {{
+        .node-status {
             padding: 6px 12px;
             border-radius: 20px;
             font-weight: 600;
             font-size: 0.9em;
-        }}
+        }
         
-        .status-critical {{
+        .status-critical {
             background: #fee2e2;
             color: #991b1b;
-        }}
+        }
         
-        .status-warning {{
+        .status-warning {
             background: #fef3c7;
             color: #92400e;
-        }}
+        }
         
-        .status-healthy {{
+        .status-healthy {
             background: #d1fae5;
             color: #065f46;
-        }}
+        }
         
-        .node-body {{
+        .node-body {
             display: none;
             padding: 20px;
-        }}
+        }
         
-        .node.expanded .node-body {{
+        .node.expanded .node-body {
             display: block;
-        }}
+        }
         
-        .node.expanded .node-header {{
+        .node.expanded .node-header {
             background: #667eea;
             color: white;
-        }}
+        }
         
-        .node.expanded .node-title {{
+        .node.expanded .node-title {
             color: white;
-        }}
+        }
         
-        .detail {{
+        .detail {
             background: #f9fafb;
             padding: 15px;
             margin-bottom: 10px;
             border-left: 4px solid #667eea;
             border-radius: 4px;
-        }}
+        }
         
-        .detail strong {{
+        .detail strong {
             color: #1f2937;
             display: block;
             margin-bottom: 5px;
-        }}
+        }
         
-        .detail .value {{
+        .detail .value {
             color: #4b5563;
             font-family: 'Courier New', monospace;
-        }}
+        }
+        
+        .detail.passed {
+            border-left-color: #10b981;
+            background: #d1fae5;
+        }
         
-        .issue {{
+        .passed-check {
+            background: #d1fae5;
+            border-left: 4px solid #10b981;
+            padding: 10px;
+            margin: 5px 0;
+            border-radius: 4px;
+        }
+        
+        .issue {
             background: #fef2f2;
             padding: 12px;
             border-left: 4px solid #ef4444;
             border-radius: 4px;
             margin-bottom: 10px;
-        }}
+        }
         
-        .issue.warning {{
+        .issue.warning {
             background: #fef3c7;
             border-left-color: #f59e0b;
-        }}
+        }
         
-        .issue strong {{
+        .issue strong {
             color: #991b1b;
             display: block;
             margin-bottom: 5px;
-        }}
+        }
         
-        .issue.warning strong {{
+        .issue.warning strong {
             color: #92400e;
-        }}
+        }
         
-        .recommendation {{
+        .recommendation {
             background: #eff6ff;
             padding: 12px;
             border-left: 4px solid #3b82f6;
             border-radius: 4px;
             margin-top: 10px;
             color: #1e40af;
-        }}
+        }
         
-        .port-check {{
+        .port-check {
             background: #f9fafb;
             padding: 10px;
             margin: 5px 0;
             border-radius: 4px;
             font-family: 'Courier New', monospace;
             font-size: 0.9em;
-        }}
+        }
         
-        .port-accessible {{
+        .port-accessible {
             color: #ef4444;
-        }}
+        }
         
-        .port-closed {{
+        .port-closed {
             color: #10b981;
-        }}
+        }
         
-        .ai-insights {{
+        .ai-insights {
             background: #eff6ff;
             padding: 15px;
             margin-top: 15px;
             border-left: 4px solid #3b82f6;
             border-radius: 4px;
-        }}
+        }
         
-        .ai-insights strong {{
+        .ai-insights strong {
             color: #1e40af;
             display: block;
             margin-bottom: 10px;
-        }}
+        }
         
-        .ai-analysis-container {{
+        .ai-analysis-container {
             background: #f8fafc;
             border: 1px solid #e2e8f0;
             border-radius: 8px;
             padding: 30px;
             margin-top: 20px;
-        }}
+        }
+        
+        .ai-incomplete {
+            color: #b45309;
+            font-weight: 600;
+            margin-top: 10px;
+        }
         
-        .ai-section {{
+        .ai-section {
             margin-bottom: 30px;
             padding-bottom: 20px;
             border-bottom: 1px solid #e2e8f0;
-        }}
+        }
         
-        .ai-section:last-child {{
+        .ai-section:last-child {
             border-bottom: none;
             margin-bottom: 0;
             padding-bottom: 0;
-        }}
+        }
         
-        .ai-heading {{
+        .ai-heading {
             color: #1e40af;
             font-size: 1.3em;
             font-weight: 700;
             margin-bottom: 15px;
             padding-bottom: 10px;
             border-bottom: 2px solid #3b82f6;
-        }}
+        }
         
-        .ai-content {{
+        .ai-content {
             color: #374151;
             line-height: 1.8;
             font-size: 0.95em;
-        }}
+        }
         
-        .ai-content p {{
+        .ai-content p {
             margin-bottom: 12px;
-        }}
+        }
         
-        .ai-content p:last-child {{
+        .ai-content p:last-child {
             margin-bottom: 0;
-        }}
+        }
         
-        .ai-content strong {{
+        .ai-content strong {
             color: #1e40af;
             font-weight: 600;
-        }}
+        }
         
-        .ai-list {{
+        .ai-list {
             list-style: none;
             padding-left: 0;
             margin: 15px 0;
-        }}
+        }
         
-        .ai-list li {{
+        .ai-list li {
             padding: 10px 15px;
             margin-bottom: 8px;
             background: white;
             border-left: 4px solid #3b82f6;
             border-radius: 4px;
-        }}
+        }
         
-        .ai-list li:last-child {{
+        .ai-list li:last-child {
             margin-bottom: 0;
-        }}
+        }
         
-        .ai-list li strong {{
+        .ai-list li strong {
             color: #1e40af;
             display: inline-block;
             margin-right: 5px;
-        }}
+        }
         
-        .btn-expand {{
+        .btn-expand {
             background: #667eea;
             color: white;
             border: none;
@@ -389,20 +404,146 @@ class HTMLReportGenerator:
             cursor: pointer;
             font-weight: 600;
             margin: 20px 0;
-        }}
+        }
         
-        .btn-expand:hover {{
+        .btn-expand:hover {
             background: #5568d3;
-        }}
+        }
         
-        @media print {{
-            body {{
+        @media print {
+            body {
                 background: white;
                 padding: 0;
-            }}
-            .node-body {{
+            }
+            .node-body {
                 display: block !important;
-            }}
+            }
+        }
+""")
+    
+    _SCRIPT = """
+        document.querySelectorAll('.node-header').forEach(header => {
+            header.addEventListener('click', function() {
+                this.parentElement.classList.toggle('expanded');
+            });
+        });
+"""
+    
+    # Buffer size for writing a report file section by section
+    WRITE_BUFFER_SIZE = 64 * 1024
+    
+    # Compression level for reports saved to a .gz path
+    GZIP_LEVEL = 6
+    
+    # Layouts repeated for every node, port check and issue
+    _NODE_TEMPLATE = '''
+            <div class="node">
+                <div class="node-header">
+                    <div class="node-title">{node_name} ({node_ip})</div>
+                    <div class="node-status {status_class}">{status_text}</div>
+                </div>
+                <div class="node-body">
+                    <div class="detail">
+                        <strong>IP Address:</strong>
+                        <div class="value">{node_ip}</div>
+                    </div>
+                    {port_checks}
+                    {passed_checks}
+                    {issues}
+                </div>
+            </div>'''
+    
+    _PORT_CHECK_TEMPLATE = '''
+            <div class="port-check">
+                {label} Port {port}: <span class="{status_class}">{status_text}</span>
+            </div>'''
+    
+    _ISSUE_TEMPLATE = '''
+            <div class="{issue_class}">
+                <strong>{severity}: {issue_type}</strong>
+                <div>{description}</div>
+                {recommendation}
+            </div>'''
+    
+    @staticmethod
+    def generate_kubelet_report(scan_data: Dict[str, Any], analysis: Dict[str, Any] = None,
+                               output_path: str = None) -> str:
+        """
+        Generate a styled HTML report from kubelet scan data.
+        
+        Args:
+            scan_data: Kubelet scan results
+            analysis: Kubelet analysis results (optional)
+            output_path: Optional path to save the HTML file (gzip-compressed if it ends in .gz)
+            
+        Returns:
+            HTML content as string
+        """
+        html = "".join(HTMLReportGenerator._iter_report(scan_data, analysis))
+        
+        # Save to file if path provided
+        if output_path:
+            with HTMLReportGenerator._open_output(output_path) as f:
+                f.write(html)
+        
+        return html
+    
+    @staticmethod
+    def write_kubelet_report(scan_data: Dict[str, Any], analysis: Dict[str, Any], output_path: str) -> None:
+        """
+        Write a styled HTML report to a file section by section, without building it in memory.
+        
+        Args:
+            scan_data: Kubelet scan results
+            analysis: Kubelet analysis results (optional)
+            output_path: Path to save the HTML file (gzip-compressed if it ends in .gz)
+        """
+        with HTMLReportGenerator._open_output(output_path) as f:
+            f.writelines(HTMLReportGenerator._iter_report(scan_data, analysis))
+    
+    @staticmethod
+    def _open_output(output_path: str):
+        """Open a report file for writing, compressing it with gzip when the path ends in .gz."""
+        if output_path.endswith('.gz'):
+            return gzip.open(output_path, 'wt', compresslevel=HTMLReportGenerator.GZIP_LEVEL, encoding='utf-8')
+        return open(output_path, 'w', buffering=HTMLReportGenerator.WRITE_BUFFER_SIZE, encoding='utf-8')
+    
+    @staticmethod
+    def _iter_report(scan_data: Dict[str, Any], analysis: Dict[str, Any] = None) -> Iterator[str]:
+        """Generate the HTML report in order, one section at a time."""
+        summary = scan_data.get('summary', {})
+        nodes = scan_data.get('nodes', [])
+        
+        total_nodes = summary.get('total_nodes', 0)
+        nodes_with_issues = summary.get('nodes_with_issues', 0)
+        status = scan_data.get('status', 'UNKNOWN')
+        
+        # Determine overall status
+        if status == 'CRITICAL':
+            status_color = "#ef4444"
+        elif status == 'WARNING':
+            status_color = "#f59e0b"
+        else:
+            status_color = "#10b981"
+        
+        # Calculate values before f-string
+        healthy_nodes = total_nodes - nodes_with_issues
+        generated_at = time.strftime('%Y-%m-%d %H:%M:%S UTC', time.gmtime())
+        scan_time = _escape(scan_data.get('scan_time', 'Unknown'))
+        status_text = _escape(status)
+        
+        # Generate HTML
+        yield f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Kubernetes Kubelet Security Check Report - {generated_at}</title>
+    <style>"""
+        yield HTMLReportGenerator._CSS
+        yield f"""        
+        .status-banner {{
+            background: {status_color};
         }}
     </style>
 </head>
@@ -410,11 +551,11 @@ class HTMLReportGenerator:
     <div class="container">
         <div class="header">
             <h1>🔐 Kubernetes Kubelet Security Check</h1>
-            <div class="timestamp">Generated: {scan_data.get('scan_time', 'Unknown')}</div>
+            <div class="timestamp">Generated: {scan_time}</div>
         </div>
         
         <div class="status-banner">
-            Status: {status}
+            Status: {status_text}
         </div>
         
         <div class="summary">
@@ -433,30 +574,25 @@ class HTMLReportGenerator:
         </div>
         
         <div class="content">
-            {HTMLReportGenerator._generate_passed_checks_section(analysis)}
-            {HTMLReportGenerator._generate_critical_issues_section(analysis)}
-            {HTMLReportGenerator._generate_node_list(nodes)}
-            {HTMLReportGenerator._generate_recommendations_section(analysis)}
-            {HTMLReportGenerator._generate_ai_analysis_section(analysis)}
+            """
+        yield HTMLReportGenerator._generate_passed_checks_section(analysis)
+        yield "\n            "
+        yield HTMLReportGenerator._generate_critical_issues_section(analysis)
+        yield "\n            "
+        yield from HTMLReportGenerator._iter_node_list(nodes)
+        yield "\n            "
+        yield HTMLReportGenerator._generate_recommendations_section(analysis)
+        yield "\n            "
+        yield HTMLReportGenerator._generate_ai_analysis_section(analysis)
+        yield """
         </div>
     </div>
     
-    <script>
-        document.querySelectorAll('.node-header').forEach(header => {{
-            header.addEventListener('click', function() {{
-                this.parentElement.classList.toggle('expanded');
-            }});
-        }});
-    </script>
+    <script>"""
+        yield HTMLReportGenerator._SCRIPT
+        yield """    </script>
 </body>
 </html>"""
-        
-        # Save to file if path provided
-        if output_path:
-            with open(output_path, 'w') as f:
-                f.write(html)
-        
-        return html
     
     @staticmethod
     def _generate_passed_checks_section(analysis: Dict[str, Any]) -> str:
@@ -468,38 +604,21 @@ class HTMLReportGenerator:
         if not passed_checks:
             return ""
         
-        checks_html = '<div class="section"><h2>✅ Security Checks Passed</h2>'
+        html_parts = ['<div class="section"><h2>✅ Security Checks Passed</h2>']
         
-        # Group by check type
-        check_types = {}
-        for check in passed_checks:
-            check_type = check.get('check', 'unknown')
-            if check_type not in check_types:
-                check_types[check_type] = []
-            check_types[check_type].append({
-                'node': check.get('node', 'Unknown'),
-                'description': check.get('description', '')
-            })
-        
-        for check_type, checks in check_types.items():
-            # Show unique descriptions
-            unique_descriptions = {}
-            for check in checks:
-                desc = check['description']
-                if desc not in unique_descriptions:
-                    unique_descriptions[desc] = []
-                unique_descriptions[desc].append(check['node'])
-            
-            for desc, nodes in unique_descriptions.items():
-                nodes_list = ', '.join(set(nodes))
-                checks_html += f'''
-                <div class="detail" style="border-left-color: #10b981; background: #d1fae5;">
-                    <strong>✅ {desc}</strong>
+        # Group by check type, then unique description: sort once and walk the runs
+        ordered_checks = sorted(passed_checks, key=_passed_check_group)
+        for (_, desc), checks in groupby(ordered_checks, key=_passed_check_group):
+            # The scanner lists each node once per check, in scan order (the sort is stable)
+            nodes_list = _escape(', '.join(check.get('node', 'Unknown') for check in checks))
+            html_parts.append(f'''
+                <div class="detail passed">
+                    <strong>✅ {_escape(desc)}</strong>
                     <div class="value">Nodes: {nodes_list}</div>
-                </div>'''
+                </div>''')
         
-        checks_html += '</div>'
-        return checks_html
+        html_parts.append('</div>')
+        return ''.join(html_parts)
     
     @staticmethod
     def _generate_critical_issues_section(analysis: Dict[str, Any]) -> str:
@@ -507,35 +626,45 @@ class HTMLReportGenerator:
         if not analysis or not analysis.get('critical_risks'):
             return ""
         
-        issues_html = '<div class="section"><h2>🔴 Critical Issues</h2>'
+        html_parts = ['<div class="section"><h2>🔴 Critical Issues</h2>']
         for risk in analysis['critical_risks']:
-            node_name = risk.get('node', 'Unknown')
-            issue_desc = risk.get('issue', 'Unknown issue')
-            issues_html += f'''
+            node_name = _escape(risk.get('node', 'Unknown'))
+            issue_desc = _escape(risk.get('issue', 'Unknown issue'))
+            html_parts.append(f'''
             <div class="issue">
                 <strong>{node_name}</strong>
                 <div>{issue_desc}</div>
-            </div>'''
-        issues_html += '</div>'
-        return issues_html
+            </div>''')
+        html_parts.append('</div>')
+        return ''.join(html_parts)
     
     @staticmethod
-    def _generate_node_list(nodes: list) -> str:
-        """Generate node list section."""
+    def _iter_node_list(nodes: list) -> Iterator[str]:
+        """Generate node list section, one node at a time."""
         if not nodes:
-            return '<div class="section"><h2>📋 Nodes</h2><p>No nodes found.</p></div>'
+            yield '<div class="section"><h2>📋 Nodes</h2><p>No nodes found.</p></div>'
+            return
         
-        nodes_html = '<div class="section"><h2>📋 Node Details</h2>'
+        yield '<div class="section"><h2>📋 Node Details</h2>'
         
         for node in nodes:
-            node_name = node.get('name', 'Unknown')
-            node_ip = node.get('ip', 'N/A')
-            issues = node.get('issues', [])
+            try:
+                name, ip, issues, port_checks, passed_checks = _NODE_FIELDS(node)
+            except KeyError:
+                # Partial node entry (not written by the scanner), fall back to defaults
+                name, ip = node.get('name', 'Unknown'), node.get('ip', 'N/A')
+                issues, port_checks = node.get('issues', []), node.get('port_checks', {})
+                passed_checks = node.get('passed_checks', [])
+            node_name = _escape(name)
+            node_ip = _escape(ip)
             issues_count = len(issues)
-            port_checks = node.get('port_checks', {})
             
-            # Determine status
-            has_critical = any(issue.get('severity') == 'CRITICAL' for issue in issues)
+            # Determine status, using the scanner's severity count when present
+            critical_count = node.get('critical_count')
+            if critical_count is None:
+                has_critical = any(issue.get('severity') == 'CRITICAL' for issue in issues)
+            else:
+                has_critical = critical_count > 0
             if has_critical:
                 status_class = 'status-critical'
                 status_text = 'CRITICAL'
@@ -546,25 +675,17 @@ class HTMLReportGenerator:
                 status_class = 'status-healthy'
                 status_text = 'HEALTHY'
             
-            nodes_html += f'''
-            <div class="node">
-                <div class="node-header">
-                    <div class="node-title">{node_name} ({node_ip})</div>
-                    <div class="node-status {status_class}">{status_text}</div>
-                </div>
-                <div class="node-body">
-                    <div class="detail">
-                        <strong>IP Address:</strong>
-                        <div class="value">{node_ip}</div>
-                    </div>
-                    {HTMLReportGenerator._generate_port_checks(port_checks)}
-                    {HTMLReportGenerator._generate_node_passed_checks(node.get('passed_checks', []))}
-                    {HTMLReportGenerator._generate_node_issues(issues)}
-                </div>
-            </div>'''
+            yield HTMLReportGenerator._NODE_TEMPLATE.format_map({
+                'node_name': node_name,
+                'node_ip': node_ip,
+                'status_class': status_class,
+                'status_text': status_text,
+                'port_checks': HTMLReportGenerator._generate_port_checks(port_checks),
+                'passed_checks': HTMLReportGenerator._generate_node_passed_checks(passed_checks),
+                'issues': HTMLReportGenerator._generate_node_issues(issues)
+            })
         
-        nodes_html += '</div>'
-        return nodes_html
+        yield '</div>'
     
     @staticmethod
     def _generate_port_checks(port_checks: Dict[str, Any]) -> str:
@@ -572,38 +693,46 @@ class HTMLReportGenerator:
         if not port_checks:
             return ""
         
-        html = '<div class="detail"><strong>Port Checks:</strong>'
+        # A skipped node was never probed, so don't report its ports as closed
+        if port_checks.get('skipped'):
+            reason = _escape(port_checks.get('reason', 'unknown'))
+            return f'<div class="detail"><strong>Port Checks:</strong><div class="port-check">SKIPPED ({reason})</div></div>'
+        
+        html_parts = ['<div class="detail"><strong>Port Checks:</strong>']
         
         default_port = port_checks.get('default_port', {})
         readonly_port = port_checks.get('readonly_port', {})
         
         if default_port:
-            port = default_port.get('port', 'N/A')
-            accessible = default_port.get('accessible', False)
-            anonymous = default_port.get('anonymous_access', False)
+            get = default_port.get
+            port, accessible, anonymous = _escape(get('port', 'N/A')), get('accessible', False), get('anonymous_access', False)
             status_class = 'port-accessible' if accessible else 'port-closed'
             status_text = 'ACCESSIBLE' if accessible else 'CLOSED'
             if anonymous:
                 status_text += ' (ANONYMOUS ACCESS)'
             
-            html += f'''
-            <div class="port-check">
-                Default Port {port}: <span class="{status_class}">{status_text}</span>
-            </div>'''
+            html_parts.append(HTMLReportGenerator._PORT_CHECK_TEMPLATE.format_map({
+                'label': 'Default',
+                'port': port,
+                'status_class': status_class,
+                'status_text': status_text
+            }))
         
         if readonly_port:
-            port = readonly_port.get('port', 'N/A')
-            accessible = readonly_port.get('accessible', False)
+            get = readonly_port.get
+            port, accessible = _escape(get('port', 'N/A')), get('accessible', False)
             status_class = 'port-accessible' if accessible else 'port-closed'
             status_text = 'ACCESSIBLE' if accessible else 'CLOSED'
             
-            html += f'''
-            <div class="port-check">
-                Readonly Port {port}: <span class="{status_class}">{status_text}</span>
-            </div>'''
-        
-        html += '</div>'
-        return html
+            html_parts.append(HTMLReportGenerator._PORT_CHECK_TEMPLATE.format_map({
+                'label': 'Readonly',
+                'port': port,
+                'status_class': status_class,
+                'status_text': status_text
+            }))
+        
+        html_parts.append('</div>')
+        return ''.join(html_parts)
     
     @staticmethod
     def _generate_node_passed_checks(passed_checks: list) -> str:
@@ -611,15 +740,15 @@ class HTMLReportGenerator:
         if not passed_checks:
             return ""
         
-        html = '<div class="detail"><strong>✅ Security Checks Passed:</strong>'
+        html_parts = ['<div class="detail"><strong>✅ Security Checks Passed:</strong>']
         for check in passed_checks:
-            description = check.get('description', 'Unknown check')
-            html += f'''
-            <div style="background: #d1fae5; border-left: 4px solid #10b981; padding: 10px; margin: 5px 0; border-radius: 4px;">
+            description = _escape(check.get('description', 'Unknown check'))
+            html_parts.append(f'''
+            <div class="passed-check">
                 <strong>✅ {description}</strong>
-            </div>'''
-        html += '</div>'
-        return html
+            </div>''')
+        html_parts.append('</div>')
+        return ''.join(html_parts)
     
     @staticmethod
     def _generate_node_issues(issues: list) -> str:
@@ -627,28 +756,29 @@ class HTMLReportGenerator:
         if not issues:
             return '<div class="detail"><strong>Issues:</strong> <div class="value">No issues found ✅</div></div>'
         
-        html = '<div class="detail"><strong>Issues:</strong>'
+        html_parts = ['<div class="detail"><strong>Issues:</strong>']
         for issue in issues:
             severity = issue.get('severity', 'UNKNOWN')
-            issue_type = issue.get('type', 'unknown')
-            description = issue.get('description', 'Unknown issue')
+            issue_type = _escape(issue.get('type', 'unknown'))
+            description = _escape(issue.get('description', 'Unknown issue'))
             recommendation = issue.get('recommendation', '')
             
             issue_class = 'issue' if severity == 'CRITICAL' else 'issue warning'
             
             recommendation_html = ''
             if recommendation:
-                recommendation_html = f'<div class="recommendation">💡 {recommendation}</div>'
+                recommendation_html = f'<div class="recommendation">💡 {_escape(recommendation)}</div>'
             
-            html += f'''
-            <div class="{issue_class}">
-                <strong>{severity}: {issue_type}</strong>
-                <div>{description}</div>
-                {recommendation_html}
-            </div>'''
-        
-        html += '</div>'
-        return html
+            html_parts.append(HTMLReportGenerator._ISSUE_TEMPLATE.format_map({
+                'issue_class': issue_class,
+                'severity': _escape(severity),
+                'issue_type': issue_type,
+                'description': description,
+                'recommendation': recommendation_html
+            }))
+        
+        html_parts.append('</div>')
+        return ''.join(html_parts)
     
     @staticmethod
     def _generate_recommendations_section(analysis: Dict[str, Any]) -> str:
@@ -656,11 +786,11 @@ class HTMLReportGenerator:
         if not analysis or not analysis.get('recommendations'):
             return ""
         
-        html = '<div class="section"><h2>💡 Recommendations</h2>'
+        html_parts = ['<div class="section"><h2>💡 Recommendations</h2>']
         for rec in analysis['recommendations']:
-            html += f'<div class="recommendation">• {rec}</div>'
-        html += '</div>'
-        return html
+            html_parts.append(f'<div class="recommendation">• {_escape(rec)}</div>')
+        html_parts.append('</div>')
+        return ''.join(html_parts)
     
     @staticmethod
     def _generate_ai_analysis_section(analysis: Dict[str, Any]) -> str:
@@ -674,12 +804,19 @@ class HTMLReportGenerator:
         if not ai_text:
             return ""
         
-        # Format the AI analysis with proper HTML structure
-        formatted_assessment = HTMLReportGenerator._format_ai_analysis_text(ai_text)
+        # Escape the raw text, then format the AI analysis with proper HTML structure
+        formatted_assessment = HTMLReportGenerator._format_ai_analysis_text(_escape(ai_text))
+        
+        # A partial response must not read as the full analysis
+        incomplete_note = (
+            '<div class="ai-incomplete">⚠️ (analysis incomplete: the AI response was cut off)</div>'
+            if ai_insights.get('truncated') else ''
+        )
         
         return f"""
         <div class="section">
             <h2>🤖 AI-Powered Risk Analysis</h2>
+            {incomplete_note}
             <div class="ai-analysis-container">
                 {formatted_assessment}
             </div>
@@ -692,46 +829,54 @@ class HTMLReportGenerator:
         if not text:
             return ""
         
-        # Split text by section headings (format: **1. Title**)
-        # Use a regex that captures the heading and content separately
-        pattern = r'(\*\*\d+\.\s+[^*]+\*\*)'
-        parts = re.split(pattern, text)
+        # Without any **N. heading marker there are no sections to split out
+        if '**' not in text or not _AI_HEADING_RE.search(text):
+            return f'<div class="ai-content">{HTMLReportGenerator._convert_markdown_to_html(text)}</div>'
         
         html_parts = []
         current_section = False
         
-        for i, part in enumerate(parts):
-            part = part.strip()
-            if not part:
-                continue
-            
-            # Check if this is a heading (starts with ** and has a number)
-            if re.match(r'\*\*\d+\.', part):
+        for kind, value in HTMLReportGenerator._tokenize_ai_analysis(text):
+            if kind == 'heading':
                 # Close previous section if exists
                 if current_section:
                     html_parts.append('</div></div>')
                 
-                # Extract heading text (remove ** markers)
-                heading_text = re.sub(r'\*\*', '', part)
-                
                 # Start new section
-                html_parts.append(f'<div class="ai-section"><h3 class="ai-heading">{heading_text}</h3><div class="ai-content">')
+                html_parts.append(f'<div class="ai-section"><h3 class="ai-heading">{value}</h3><div class="ai-content">')
                 current_section = True
             else:
                 # This is content - convert markdown to HTML
-                formatted = HTMLReportGenerator._convert_markdown_to_html(part)
-                html_parts.append(formatted)
-        
-        # Close last section
-        if current_section:
-            html_parts.append('</div></div>')
+                html_parts.append(HTMLReportGenerator._convert_markdown_to_html(value))
         
-        result = ''.join(html_parts)
         # If no sections were found, format the whole text
         if not current_section:
-            result = f'<div class="ai-content">{HTMLReportGenerator._convert_markdown_to_html(text)}</div>'
+            return f'<div class="ai-content">{HTMLReportGenerator._convert_markdown_to_html(text)}</div>'
         
-        return result
+        # Close last section
+        html_parts.append('</div></div>')
+        return ''.join(html_parts)
+    
+    @staticmethod
+    def _tokenize_ai_analysis(text: str) -> Iterator[Tuple[str, str]]:
+        """
+        Split AI analysis text into ('heading', title) and ('content', markdown) tokens.
+        
+        Section headings (format: **1. Title**) are found in a single forward scan,
+        and the text between them is passed on as content.
+        """
+        pos = 0
+        for match in _AI_SECTION_HEADING_RE.finditer(text):
+            content = text[pos:match.start()].strip()
+            if content:
+                yield 'content', content
+            # Heading text without the ** markers
+            yield 'heading', match.group().replace('**', '')
+            pos = match.end()
+        
+        content = text[pos:].strip()
+        if content:
+            yield 'content', content
     
     @staticmethod
     def _convert_markdown_to_html(text: str) -> str:
@@ -739,12 +884,12 @@ class HTMLReportGenerator:
         if not text:
             return ""
         
-        # First, convert **bold** to <strong> (but avoid converting if it's part of a heading pattern)
-        # We'll do this more carefully to avoid double conversion
-        text = re.sub(r'\*\*([^*]+)\*\*', r'<strong>\1</strong>', text)
+        # Convert **bold** to <strong> in one pass over the whole text, so lines
+        # and list items need no further markdown cleanup
+        text = _BOLD_RE.sub(r'<strong>\1</strong>', text)
         
         # Split into lines for processing
-        lines = text.split('\n')
+        lines = text.splitlines()
         formatted_lines = []
         in_list = False
         current_paragraph = []
@@ -764,15 +909,13 @@ class HTMLReportGenerator:
             
             # Check if it's a numbered list item (format: 1. item or **1. item**)
             # But not if it's already been converted to a heading
-            list_match = re.match(r'(?:<strong>)?(\d+)\.\s+(.+?)(?:</strong>)?$', line)
+            list_match = _LIST_ITEM_RE.match(line)
             if list_match and not line.startswith('<h3'):
                 if not in_list:
                     formatted_lines.append('<ul class="ai-list">')
                     in_list = True
                 
                 item_text = list_match.group(2).strip()
-                # Clean up any remaining markdown
-                item_text = re.sub(r'\*\*([^*]+)\*\*', r'<strong>\1</strong>', item_text)
                 formatted_lines.append(f'<li>{item_text}</li>')
             else:
                 # Regular text - add to current paragraph
@@ -780,9 +923,7 @@ class HTMLReportGenerator:
                     formatted_lines.append('</ul>')
                     in_list = False
                 
-                # Clean up the line
-                cleaned_line = re.sub(r'\*\*([^*]+)\*\*', r'<strong>\1</strong>', line)
-                current_paragraph.append(cleaned_line)
+                current_paragraph.append(line)
         
         # Close any open structures
         if in_list:
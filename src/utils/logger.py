@@ -6,7 +6,6 @@ Handles application logging configuration.
 
 import logging
 import sys
-from typing import Optional
 
 
 def setup_logging(level: str = "INFO", debug: bool = False) -> None:
@@ -0,0 +1,67 @@
+"""
+Tests for marking an interrupted AI analysis stream as incomplete.
+"""
+
+import sys
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+from kubelet_scanner.analyzer import KubeletAnalyzer
+from slack_app.formatter import SlackFormatter
+from utils.html_report import HTMLReportGenerator
+
+
+def _chunk(text):
+    return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=text))])
+
+
+def _stream(*texts, error=None):
+    for text in texts:
+        yield _chunk(text)
+    if error:
+        raise error
+
+
+SCAN_RESULTS = {'status': 'HEALTHY', 'summary': {'total_nodes': 1, 'nodes_with_issues': 0}, 'nodes': []}
+
+
+class AIInsightsTruncationTest(unittest.TestCase):
+    """A stream that breaks partway is flagged and shown as incomplete."""
+    
+    def _analyze(self, stream):
+        analyzer = KubeletAnalyzer(openai_api_key='sk-test')
+        analyzer._openai_client = mock.Mock()
+        analyzer._openai_client.chat.completions.create.return_value = stream
+        return analyzer.analyze_results(SCAN_RESULTS)
+    
+    def test_complete_stream_is_not_truncated(self):
+        analysis = self._analyze(_stream('**1. Risk**', ' low'))
+        
+        self.assertEqual(analysis['ai_insights']['analysis'], '**1. Risk** low')
+        self.assertFalse(analysis['ai_insights']['truncated'])
+    
+    def test_interrupted_stream_is_flagged_and_reported_incomplete(self):
+        analysis = self._analyze(_stream('**1. Risk**', ' hi', error=ConnectionError('reset')))
+        
+        self.assertEqual(analysis['ai_insights']['analysis'], '**1. Risk** hi')
+        self.assertTrue(analysis['ai_insights']['truncated'])
+        
+        summary = {'total_nodes': 1, 'nodes_with_issues': 0, 'status': 'HEALTHY', 'nodes': []}
+        blocks = SlackFormatter.create_kubelet_blocks(summary, analysis)
+        self.assertTrue(any('analysis incomplete' in block.get('text', {}).get('text', '') for block in blocks))
+        
+        html = HTMLReportGenerator._generate_ai_analysis_section(analysis)
+        self.assertIn('analysis incomplete', html)
+    
+    def test_stream_failing_before_any_text_gives_no_insights(self):
+        analysis = self._analyze(_stream(error=ConnectionError('reset')))
+        
+        self.assertIsNone(analysis['ai_insights'])
+
+
+if __name__ == '__main__':
+    unittest.main()
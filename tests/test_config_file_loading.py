@@ -0,0 +1,51 @@
+"""
+Tests for loading YAML and TOML config files.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+from utils import config as config_module
+from utils import Config
+
+
+class ConfigFileLoadingTest(unittest.TestCase):
+    """Config files are parsed by their format and never shared between instances."""
+    
+    def _write(self, name, text):
+        path = os.path.join(tempfile.mkdtemp(), name)
+        with open(path, 'w') as f:
+            f.write(text)
+        self.addCleanup(os.rmdir, os.path.dirname(path))
+        self.addCleanup(os.remove, path)
+        return path
+    
+    def test_toml_config_is_loaded(self):
+        path = self._write('config.toml', '[slack]\nchannel = "#toml-channel"\n')
+        
+        self.assertEqual(Config(path).get_slack_channel(), '#toml-channel')
+    
+    def test_toml_config_without_tomllib_raises(self):
+        path = self._write('config.toml', '[slack]\nchannel = "#toml-channel"\n')
+        
+        with mock.patch.object(config_module, 'TOMLLIB_AVAILABLE', False):
+            with self.assertRaisesRegex(ValueError, 'tomllib'):
+                Config(path)
+    
+    def test_cached_config_data_is_not_shared(self):
+        path = self._write('config.yaml', 'slack:\n  channel: "#yaml-channel"\n')
+        
+        first = Config(path)
+        first.config_data['slack']['channel'] = '#changed'
+        
+        self.assertEqual(Config(path).config_data['slack']['channel'], '#yaml-channel')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+"""
+Tests for matching kubelet versions against the known CVE table.
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+from kubelet_scanner.scanner import _CRITICAL_CVES, _cve_lookup, _parse_version
+
+
+def _cves(version):
+    return [vuln['cve'] for vuln in _cve_lookup(version)['known_vulnerabilities']]
+
+
+class CVELookupTest(unittest.TestCase):
+    """Versions below a CVE's bound match it, and the scan stops at the first bound they're not below."""
+    
+    def test_table_is_sorted_by_bound_highest_first(self):
+        bounds = [cve[3] for cve in _CRITICAL_CVES]
+        
+        self.assertEqual(bounds, sorted(bounds, reverse=True))
+    
+    def test_old_version_matches_every_cve(self):
+        self.assertEqual(_cves('v1.27.2'), ['CVE-2023-5528', 'CVE-2023-5529', 'CVE-2023-3978'])
+    
+    def test_version_at_a_bound_is_not_affected_by_it(self):
+        self.assertEqual(_cves('v1.27.3'), ['CVE-2023-5528', 'CVE-2023-5529'])
+        self.assertEqual(_cves('v1.27.4'), ['CVE-2023-5528'])
+    
+    def test_patched_versions_are_not_vulnerable(self):
+        for version in ('v1.28.0', 'v1.28', 'v1.29.1'):
+            with self.subTest(version=version):
+                result = _cve_lookup(version)
+                self.assertFalse(result['is_vulnerable'])
+                self.assertEqual(result['known_vulnerabilities'], [])
+    
+    def test_versions_compare_numerically(self):
+        # A string comparison would put 1.100 below 1.28
+        self.assertEqual(_cves('v1.100.0'), [])
+        self.assertEqual(_parse_version('v1.28.0'), _parse_version('1.28'))
+    
+    def test_unparsable_version_is_not_vulnerable(self):
+        self.assertFalse(_cve_lookup('v1.28.0-eks')['is_vulnerable'])
+
+
+if __name__ == '__main__':
+    unittest.main()
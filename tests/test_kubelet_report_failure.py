@@ -0,0 +1,52 @@
+"""
+Tests for cleaning up the HTML report when sending the kubelet report fails.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+from slack_app.notifier import SlackNotifier
+
+
+SCAN_DATA = {'summary': {'total_nodes': 1, 'nodes_with_issues': 0}, 'nodes': []}
+
+
+class FailingClient:
+    """Slack client stand-in whose message post always fails."""
+    
+    default_channel = '#security'
+    
+    def send_rich_message(self, **kwargs):
+        raise RuntimeError('channel_not_found')
+    
+    def send_file(self, *args, **kwargs):
+        raise AssertionError('report must not be uploaded when the post fails')
+
+
+class KubeletReportFailureTest(unittest.TestCase):
+    """A failed send must not leave a rendered report behind."""
+    
+    def setUp(self):
+        self.report_dir = tempfile.mkdtemp()
+        patcher = mock.patch.object(SlackNotifier, 'REPORT_DIR', self.report_dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(os.rmdir, self.report_dir)
+    
+    def test_failed_post_removes_html_report(self):
+        notifier = SlackNotifier(FailingClient())
+        
+        with self.assertRaises(RuntimeError):
+            notifier.send_kubelet_report(SCAN_DATA, {})
+        
+        self.assertEqual(os.listdir(self.report_dir), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+"""
+Tests for the watch-backed node cache.
+"""
+
+import sys
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+from kubernetes.client.rest import ApiException
+
+from kubelet_scanner import node_cache as node_cache_module
+from kubelet_scanner.node_cache import NodeCache
+
+
+def _node(name, resource_version='1'):
+    return SimpleNamespace(metadata=SimpleNamespace(name=name, resource_version=resource_version))
+
+
+class FakeCoreV1Api:
+    """Lists the current nodes, reporting a new resourceVersion on every list."""
+    
+    def __init__(self, nodes):
+        self.nodes = nodes
+        self.list_calls = 0
+    
+    def list_node(self, **kwargs):
+        self.list_calls += 1
+        return SimpleNamespace(
+            items=list(self.nodes),
+            metadata=SimpleNamespace(_continue=None, resource_version=str(self.list_calls))
+        )
+
+
+class FakeWatch:
+    """Plays back one scripted stream per watch; an exception in the script is raised instead."""
+    
+    def __init__(self, streams, cache):
+        self.streams = streams
+        self.cache = cache
+        self.resource_versions = []
+    
+    def __call__(self):
+        return self
+    
+    def stream(self, func, resource_version=None, timeout_seconds=None):
+        self.resource_versions.append(resource_version)
+        for event in self.streams.pop(0):
+            if isinstance(event, Exception):
+                raise event
+            yield event
+        if not self.streams:
+            self.cache.stop()
+    
+    def stop(self):
+        pass
+
+
+class NodeCacheTest(unittest.TestCase):
+    """The cache applies watch events and re-lists after the watch expires."""
+    
+    def _run(self, v1, streams):
+        cache = NodeCache(v1, page_size=10)
+        fake_watch = FakeWatch(streams, cache)
+        with mock.patch.object(node_cache_module.watch, 'Watch', fake_watch):
+            cache._run()
+        return cache, fake_watch
+    
+    def test_watch_events_update_the_cache(self):
+        v1 = FakeCoreV1Api([_node('worker-1'), _node('worker-2')])
+        streams = [[
+            {'type': 'ADDED', 'object': _node('worker-3', '5')},
+            {'type': 'DELETED', 'object': _node('worker-1', '6')}
+        ]]
+        
+        cache, _ = self._run(v1, streams)
+        
+        self.assertTrue(cache.wait_for_sync(0))
+        self.assertEqual(sorted(node.metadata.name for node in cache.nodes()), ['worker-2', 'worker-3'])
+    
+    def test_gone_watch_relists_from_a_fresh_resource_version(self):
+        v1 = FakeCoreV1Api([_node('worker-1')])
+        streams = [
+            [ApiException(status=410, reason='Gone')],
+            [{'type': 'MODIFIED', 'object': _node('worker-1', '9')}]
+        ]
+        
+        cache, fake_watch = self._run(v1, streams)
+        
+        self.assertEqual(v1.list_calls, 2)
+        self.assertEqual(fake_watch.resource_versions, ['1', '2'])
+        self.assertEqual([node.metadata.resource_version for node in cache.nodes()], ['9'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,38 @@
+"""
+Tests for limiting gzip compression to the node list requests.
+"""
+
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+from kubelet_scanner import scanner as scanner_module
+from kubelet_scanner.node_cache import NodeCache
+from kubelet_scanner.scanner import KubeletScanner
+
+
+class NodeListCompressionTest(unittest.TestCase):
+    """Node lists ask for gzip, the raw-streamed node watch doesn't."""
+    
+    def setUp(self):
+        patches = [
+            mock.patch.object(scanner_module.config, 'load_incluster_config'),
+            mock.patch.object(NodeCache, 'start')
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+    
+    def test_gzip_header_only_on_list_client(self):
+        scanner = KubeletScanner(watch_nodes=True)
+        self.addCleanup(scanner.close)
+        
+        self.assertEqual(scanner.v1.api_client.default_headers.get('Accept-Encoding'), 'gzip')
+        self.assertNotIn('Accept-Encoding', scanner._node_watcher.v1.api_client.default_headers)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+"""
+Tests for pacing Slack API calls with token buckets.
+"""
+
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+from slack_app import client as client_module
+from slack_app.client import SlackClient, _TokenBucket
+
+
+class TokenBucketTest(unittest.TestCase):
+    """Calls beyond the burst wait their turn, without holding the bucket's lock while they sleep."""
+    
+    def setUp(self):
+        # Freeze the clock so the bucket never refills on its own
+        patcher = mock.patch.object(client_module.time, 'monotonic', return_value=100.0)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def _acquire(self, bucket, times):
+        waits = []
+        
+        def sleep(seconds):
+            self.assertFalse(bucket._lock.locked())
+            waits.append(seconds)
+        
+        with mock.patch.object(client_module.time, 'sleep', side_effect=sleep):
+            for _ in range(times):
+                bucket.acquire()
+        return waits
+    
+    def test_burst_is_not_delayed(self):
+        self.assertEqual(self._acquire(_TokenBucket(rate=1.0, capacity=3), 3), [])
+    
+    def test_waiting_callers_queue_up(self):
+        waits = self._acquire(_TokenBucket(rate=2.0, capacity=1), 4)
+        
+        self.assertEqual(waits, [0.5, 1.0, 1.5])
+    
+    def test_messages_are_paced_per_channel(self):
+        slack_client = SlackClient('xoxb-test')
+        
+        waits = []
+        with mock.patch.object(client_module.time, 'sleep', side_effect=waits.append):
+            for channel in ('#a', '#b', '#a'):
+                slack_client._wait_for_rate_limit('message', channel)
+        
+        self.assertEqual(waits, [1.0 / SlackClient.MESSAGE_RATE])
+
+
+if __name__ == '__main__':
+    unittest.main()
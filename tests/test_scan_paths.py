@@ -0,0 +1,154 @@
+"""
+Tests that the asyncio and thread pool scan paths report kubelets the same way.
+"""
+
+import os
+import shutil
+import socket
+import ssl
+import subprocess
+import sys
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+from kubelet_scanner import scanner as scanner_module
+from kubelet_scanner.scanner import KubeletScanner
+
+
+class KubeletHandler(BaseHTTPRequestHandler):
+    """Answers every request with the server's configured status code."""
+    
+    def do_HEAD(self):
+        self.send_response(self.server.status)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+    
+    def do_GET(self):
+        self.do_HEAD()
+    
+    def log_message(self, *args):
+        pass
+
+
+def _start_server(status, ssl_context=None):
+    server = ThreadingHTTPServer(('127.0.0.1', 0), KubeletHandler)
+    server.status = status
+    if ssl_context:
+        server.socket = ssl_context.wrap_socket(server.socket, server_side=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _closed_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def _node(name, ready='True'):
+    return SimpleNamespace(
+        metadata=SimpleNamespace(name=name, annotations={}),
+        status=SimpleNamespace(
+            conditions=[SimpleNamespace(type='Ready', status=ready)],
+            addresses=[SimpleNamespace(type='InternalIP', address='127.0.0.1')],
+            node_info=SimpleNamespace(kubelet_version='v1.29.0')
+        )
+    )
+
+
+class FakeCoreV1Api:
+    """Lists a fixed set of nodes in a single page."""
+    
+    def __init__(self, nodes):
+        self.nodes = nodes
+    
+    def list_node(self, **kwargs):
+        return SimpleNamespace(items=self.nodes, metadata=SimpleNamespace(_continue=None, resource_version='1'))
+
+
+class ScanPathsTest(unittest.TestCase):
+    """Open, auth-required and closed kubelet ports scan identically on both paths."""
+    
+    @classmethod
+    def setUpClass(cls):
+        if not shutil.which('openssl'):
+            raise unittest.SkipTest('openssl is needed to create a test certificate')
+        cert_dir = tempfile.mkdtemp()
+        cls.addClassCleanup(shutil.rmtree, cert_dir)
+        cert, key = os.path.join(cert_dir, 'cert.pem'), os.path.join(cert_dir, 'key.pem')
+        subprocess.run(
+            ['openssl', 'req', '-x509', '-newkey', 'rsa:2048', '-nodes', '-days', '1',
+             '-subj', '/CN=127.0.0.1', '-keyout', key, '-out', cert],
+            check=True, capture_output=True
+        )
+        cls.ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        cls.ssl_context.load_cert_chain(cert, key)
+    
+    def setUp(self):
+        patcher = mock.patch.object(scanner_module.config, 'load_incluster_config')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        
+        # Two nodes share an IP, so their probes are shared; the NotReady node is never probed
+        self.scanner = KubeletScanner(node_cache_ttl=0)
+        self.scanner.v1 = FakeCoreV1Api([_node('worker-1'), _node('worker-2'), _node('worker-3', ready='False')])
+        self.addCleanup(self.scanner.close)
+    
+    def _serve(self, status, ssl_context=None):
+        server = _start_server(status, ssl_context)
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        return server.server_address[1]
+    
+    def _scan_both_paths(self, kubelet_port, readonly_port):
+        self.scanner.DEFAULT_KUBELET_PORT = kubelet_port
+        self.scanner.DEFAULT_READONLY_PORT = readonly_port
+        
+        async_results = self.scanner.scan_kubelet_config()
+        with mock.patch.object(scanner_module, 'AIOHTTP_AVAILABLE', False):
+            thread_results = self.scanner.scan_kubelet_config()
+        
+        for key in ('nodes', 'summary', 'status'):
+            self.assertEqual(async_results[key], thread_results[key], key)
+        self.assertEqual(async_results['nodes'][2]['port_checks'], {'skipped': True, 'reason': 'NotReady'})
+        return async_results
+    
+    def test_anonymous_kubelet_and_open_readonly_port(self):
+        with self.assertLogs(scanner_module.logger, 'WARNING'):
+            results = self._scan_both_paths(self._serve(200, self.ssl_context), self._serve(200))
+        
+        port_checks = results['nodes'][0]['port_checks']
+        self.assertTrue(port_checks['default_port']['anonymous_access'])
+        self.assertTrue(port_checks['readonly_port']['accessible'])
+        self.assertFalse(port_checks['readonly_port']['anonymous_access'])
+        self.assertTrue(results['nodes'][0]['endpoint_checks']['metrics']['anonymous_access'])
+        self.assertEqual(results['status'], 'CRITICAL')
+    
+    def test_auth_required_kubelet_and_closed_readonly_port(self):
+        results = self._scan_both_paths(self._serve(401, self.ssl_context), _closed_port())
+        
+        port_checks = results['nodes'][0]['port_checks']
+        self.assertTrue(port_checks['default_port']['accessible'])
+        self.assertFalse(port_checks['default_port']['anonymous_access'])
+        self.assertEqual(port_checks['default_port']['status_code'], 401)
+        self.assertFalse(port_checks['readonly_port']['accessible'])
+        self.assertEqual(results['status'], 'HEALTHY')
+    
+    def test_closed_ports(self):
+        results = self._scan_both_paths(_closed_port(), _closed_port())
+        
+        port_checks = results['nodes'][0]['port_checks']
+        self.assertFalse(port_checks['default_port']['accessible'])
+        self.assertFalse(port_checks['readonly_port']['accessible'])
+        self.assertFalse(results['nodes'][0]['endpoint_checks']['metrics']['accessible'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+"""
+Tests for waiting on and loading the scanner's results file.
+"""
+
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+from slack_app import notifier as notifier_module
+from slack_app.notifier import SlackNotifier
+
+
+class ScanResultsWaitTest(unittest.TestCase):
+    """The results file is picked up once written, with inotify or by polling."""
+    
+    def setUp(self):
+        self.output_dir = Path(tempfile.mkdtemp())
+        self.results_file = self.output_dir / 'kubelet-scan-results.json'
+        self.addCleanup(os.rmdir, self.output_dir)
+        self.notifier = SlackNotifier(None)
+    
+    def _write_later(self, text, delay=0.2):
+        def write():
+            with open(self.results_file, 'w') as f:
+                f.write(text)
+        timer = threading.Timer(delay, write)
+        timer.start()
+        self.addCleanup(timer.join)
+        self.addCleanup(lambda: self.results_file.unlink(missing_ok=True))
+    
+    @unittest.skipUnless(notifier_module.INOTIFY_AVAILABLE, 'inotify_simple is not installed')
+    def test_inotify_wait_returns_once_file_is_written(self):
+        self._write_later('{}')
+        
+        start = time.monotonic()
+        found = self.notifier._wait_for_file(self.results_file, 10, threading.Event())
+        
+        self.assertTrue(found)
+        self.assertLess(time.monotonic() - start, 5)
+    
+    def test_polling_wait_returns_once_file_is_written(self):
+        self._write_later('{}')
+        
+        with mock.patch.object(SlackNotifier, 'CHECK_INTERVAL', 0.05):
+            found = self.notifier._wait_for_file(self.results_file, 10, threading.Event(), poll=True)
+        
+        self.assertTrue(found)
+    
+    def test_wait_times_out_without_file(self):
+        for poll in (False, True):
+            with self.subTest(poll=poll), mock.patch.object(SlackNotifier, 'CHECK_INTERVAL', 0.05):
+                self.assertFalse(self.notifier._wait_for_file(self.results_file, 0.2, threading.Event(), poll=poll))
+    
+    def test_wait_ends_when_stopped(self):
+        stop_event = threading.Event()
+        threading.Timer(0.2, stop_event.set).start()
+        
+        start = time.monotonic()
+        found = self.notifier._wait_for_file(self.results_file, 30, stop_event)
+        
+        self.assertFalse(found)
+        self.assertLess(time.monotonic() - start, 5)
+    
+    def test_truncated_results_are_retried_until_complete(self):
+        results = {'nodes': [], 'summary': {'total_nodes': 0}}
+        self.results_file.write_text(json.dumps(results)[:5])
+        self.addCleanup(self.results_file.unlink)
+        
+        def finish_writing(seconds):
+            self.results_file.write_text(json.dumps(results))
+        
+        with mock.patch.object(notifier_module.time, 'sleep', side_effect=finish_writing) as sleep:
+            self.assertEqual(self.notifier._load_scan_results(self.results_file), results)
+        self.assertEqual(sleep.call_count, 1)
+    
+    def test_results_still_truncated_after_retries_raise(self):
+        self.results_file.write_text('{"nodes": [')
+        self.addCleanup(self.results_file.unlink)
+        
+        with mock.patch.object(notifier_module.time, 'sleep'):
+            with self.assertRaises(ValueError):
+                self.notifier._load_scan_results(self.results_file)
+
+
+if __name__ == '__main__':
+    unittest.main()
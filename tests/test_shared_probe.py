@@ -0,0 +1,66 @@
+"""
+Tests for sharing one kubelet probe between callers in a scan.
+"""
+
+import sys
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+from kubelet_scanner import scanner as scanner_module
+from kubelet_scanner.scanner import KubeletScanner
+
+
+class SharedProbeTest(unittest.TestCase):
+    """Concurrent and later callers for the same key reuse a single probe."""
+    
+    def setUp(self):
+        patcher = mock.patch.object(scanner_module.config, 'load_incluster_config')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.scanner = KubeletScanner()
+        self.addCleanup(self.scanner.close)
+    
+    def test_concurrent_callers_share_one_probe(self):
+        release = threading.Event()
+        calls = []
+        
+        def probe(node_ip, port):
+            calls.append((node_ip, port))
+            release.wait(5)
+            return {'accessible': True}
+        
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(self.scanner._shared_probe, ('10.0.0.1', 10250), probe, '10.0.0.1', 10250)
+                       for _ in range(4)]
+            release.set()
+            results = [future.result() for future in futures]
+        
+        self.assertEqual(calls, [('10.0.0.1', 10250)])
+        self.assertEqual(results, [{'accessible': True}] * 4)
+    
+    def test_different_keys_are_probed_separately(self):
+        probe = mock.Mock(return_value={'accessible': False})
+        
+        self.scanner._shared_probe(('10.0.0.1', 10250), probe, '10.0.0.1', 10250)
+        self.scanner._shared_probe(('10.0.0.1', 10255), probe, '10.0.0.1', 10255)
+        self.scanner._shared_probe(('10.0.0.1', 10250), probe, '10.0.0.1', 10250)
+        
+        self.assertEqual(probe.call_count, 2)
+    
+    def test_probe_error_is_raised_to_every_caller(self):
+        probe = mock.Mock(side_effect=OSError('unreachable'))
+        
+        for _ in range(2):
+            with self.assertRaises(OSError):
+                self.scanner._shared_probe(('10.0.0.1', 10250), probe, '10.0.0.1', 10250)
+        
+        self.assertEqual(probe.call_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
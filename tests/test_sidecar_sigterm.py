@@ -0,0 +1,56 @@
+"""
+Tests for SIGTERM handling in sidecar mode.
+"""
+
+import os
+import signal
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+from app import KubeletCheckApp
+from utils import Config
+
+
+class SidecarSigtermTest(unittest.TestCase):
+    """SIGTERM ends the wait cleanly, and exits outright once the wait is over."""
+    
+    def setUp(self):
+        self.output_dir = tempfile.mkdtemp()
+        self.addCleanup(os.rmdir, self.output_dir)
+        env = {
+            'SLACK_BOT_TOKEN': 'xoxb-test',
+            'KUBELET_CHECK_OUTPUT_DIR': self.output_dir,
+            'MAX_WAIT_TIME': '30'
+        }
+        with mock.patch.dict(os.environ, env):
+            self.app = KubeletCheckApp(Config('missing-test-config.yaml'))
+        self.app.slack_notifier.client = mock.Mock(default_channel='#security')
+    
+    def test_sigterm_while_waiting_stops_cleanly(self):
+        previous_handler = signal.getsignal(signal.SIGTERM)
+        threading.Timer(0.5, os.kill, (os.getpid(), signal.SIGTERM)).start()
+        
+        start = time.monotonic()
+        exit_code = self.app.run_sidecar_mode()
+        
+        self.assertEqual(exit_code, 0)
+        self.assertLess(time.monotonic() - start, 10)
+        self.assertIs(signal.getsignal(signal.SIGTERM), previous_handler)
+    
+    def test_sigterm_after_wait_exits(self):
+        with self.assertRaises(SystemExit) as cm:
+            self.app._handle_sigterm(signal.SIGTERM, None)
+        
+        self.assertEqual(cm.exception.code, 128 + signal.SIGTERM)
+        self.assertFalse(self.app.slack_notifier.stop_event.is_set())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+"""
+Tests for reporting nodes whose kubelet probes were skipped.
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+from slack_app.formatter import SlackFormatter
+from utils.html_report import HTMLReportGenerator
+
+
+SKIPPED_NODE = {
+    'name': 'worker-1',
+    'ip': '10.0.0.1',
+    'kubelet_version': 'v1.29.0',
+    'issues': [],
+    'passed_checks': [],
+    'port_checks': {'skipped': True, 'reason': 'NotReady'},
+    'endpoint_checks': {}
+}
+
+
+class SkippedNodeReportTest(unittest.TestCase):
+    """A NotReady node that was never probed must not be reported as closed."""
+    
+    def test_slack_blocks_show_skipped_ports(self):
+        summary = {'total_nodes': 1, 'nodes_with_issues': 0, 'status': 'HEALTHY', 'nodes': [SKIPPED_NODE]}
+        blocks = SlackFormatter.create_kubelet_blocks(summary, {})
+        node_text = next(block['text']['text'] for block in blocks
+                         if block.get('text', {}).get('text', '').startswith('✅ *worker-1*'))
+        
+        self.assertIn('SKIPPED (NotReady)', node_text)
+        self.assertNotIn('CLOSED', node_text)
+    
+    def test_html_report_shows_skipped_ports(self):
+        html = HTMLReportGenerator._generate_port_checks(SKIPPED_NODE['port_checks'])
+        
+        self.assertIn('SKIPPED (NotReady)', html)
+        self.assertNotIn('CLOSED', html)
+
+
+if __name__ == '__main__':
+    unittest.main()